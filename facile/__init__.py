@@ -0,0 +1 @@
+''' FACILE core: loading and querying the AISIS class schedules, independent of the Streamlit app.'''
@@ -0,0 +1,57 @@
+''' Rechecking many saved schedules against a snapshot without the app. Each line of the input is one saved schedule
+from the Copy Paste box; each line of the output is the report of facile.saved.check_saved for that schedule, e.g.
+
+    python -m facile.batch saved.jsonl report.jsonl --folder schedules_2024-1_20240704_2024/ --workers 4'''
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from facile.catalog import load_complete_list
+from facile.reload import latest_snapshot
+from facile.saved import check_saved, section_rows
+
+snapshot = None # the complete list, masks and section rows of each worker process
+
+def load_snapshot(folder):
+    ''' Loads the snapshot once per worker process.'''
+
+    global snapshot
+    complete_list, masks = load_complete_list(folder)
+    snapshot = complete_list, masks, section_rows(complete_list)
+
+def check_line(numbered_line):
+    ''' Returns the report of one line of the input as a JSON line.'''
+
+    number, line = numbered_line
+    try:
+        complete_list, masks, rows_of = snapshot
+        report = check_saved(complete_list, masks, json.loads(line), rows_of)
+    except json.JSONDecodeError as error:
+        report = {'valid' : False, 'error' : f'Invalid JSON: {error}'}
+    return json.dumps({'line' : number, **report})
+
+def check_file(input_path, output_path, folder, workers = None, chunksize = 64):
+    ''' Checks every saved schedule in a JSONL file against a snapshot folder with a pool of processes, writing the
+    reports in the order of the input as they come. Returns the number of schedules checked.'''
+
+    count = 0
+    with open(input_path) as input_file, open(output_path, 'w') as output_file, \
+         ProcessPoolExecutor(workers, initializer = load_snapshot, initargs = (folder,)) as pool:
+        lines = ((number, line) for number, line in enumerate(input_file, 1) if line.strip() != '')
+        for report in pool.map(check_line, lines, chunksize = chunksize):
+            output_file.write(report + '\n')
+            count += 1
+    return count
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Checks saved schedules (one JSON per line) against a schedules snapshot.')
+    parser.add_argument('input', help = 'JSONL file of saved schedules')
+    parser.add_argument('output', help = 'JSONL file to write the reports to')
+    parser.add_argument('--folder', help = 'snapshot folder (default: the newest complete one)')
+    parser.add_argument('--workers', type = int, default = os.cpu_count(), help = 'number of worker processes')
+    args = parser.parse_args()
+
+    folder = args.folder or latest_snapshot()
+    print(f'{check_file(args.input, args.output, folder, args.workers)} schedules checked against {folder}')
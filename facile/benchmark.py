@@ -0,0 +1,189 @@
+''' Timing the building of the catalog and the checks run on it, on synthetic catalogs 1, 10 and 100 times the size of a
+snapshot, to see how each stage scales. Run
+
+    python -m facile.benchmark [--folder FOLDER] [--scales 1 10 100] [--output benchmark.json] [--compare old.json]
+
+to time every stage at each scale and save the times, throughputs (rows per second) and peak memory to JSON. With
+--compare, the times are also printed next to those of an older run, to catch regressions between versions.
+
+A synthetic catalog repeats the sections of the snapshot, each copy with its own sections, rooms and professors, and
+gives every section a new random Time drawn from the kinds AISIS uses: one or more days, several meetings separated by
+semicolons, D for intersession dailies, TBA and TUTORIAL.'''
+
+import argparse
+import io
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from facile.buildings import build_buildings
+from facile.catalog import Catalog, add_columns, build_rooms, load_depts, load_prefixes, load_schedules
+from facile.conflicts import double_bookings, open_sections
+from facile.grid import schedule_grid
+from facile.indexes import build_prof_index, build_room_index, build_section_index
+from facile.meetings import build_meetings
+from facile.occupancy import build_occupancy
+from facile.professors import build_teaching_load
+from facile.syllabi import snapshot_term, syllabus_links
+from facile.timeslots import NSLOTS, parse_masks
+from facile.walking import build_slot_bldgs
+
+BASE_FOLDER = 'schedules_2024-1_20240704_2024'
+SCALES = [1, 10, 100]
+REPEAT = 3 # times each stage is run; the fastest is kept
+SEED = 0
+
+# (days, minutes per meeting, share of the sections) of the times with days, as often as in the 2024-1 snapshot
+day_patterns = [('M-TH', 90, 0.30), ('T-F', 90, 0.27), ('W', 180, 0.10), ('SAT', 180, 0.07), ('M', 180, 0.03),
+                ('TH', 180, 0.03), ('T', 180, 0.02), ('F', 180, 0.01), ('W-SAT', 90, 0.01), ('D', 90, 0.02)]
+no_time_share = {'TBA' : 0.17, 'TUTORIAL' : 0.025} # of the rest of the sections
+split_share = 0.005 # of the sections with days, that meet twice
+modes = ['\n(FULLY ONSITE)', '\n(FULLY ONLINE)', '\n(~)']
+mode_shares = [0.9, 0.03, 0.07]
+
+def hhmm(slots):
+    ''' Converts slot numbers within a day (0 is 0700) into times in the form hhmm.'''
+
+    slots = np.asarray(slots)
+    return pd.Series(700 + slots // 2 * 100 + slots % 2 * 30).map('{:04}'.format).to_numpy(dtype = object)
+
+def random_times(n, rng):
+    ''' Returns n random AISIS Time strings.'''
+
+    weights = np.array([share for _, _, share in day_patterns] + list(no_time_share.values()))
+    kinds = rng.choice(len(weights), size = n, p = weights / weights.sum())
+
+    def meetings(kinds):
+        lengths = np.array([minutes // 30 for _, minutes, _ in day_patterns])[kinds]
+        starts = rng.integers(0, NSLOTS - lengths)
+        days = np.array([days for days, _, _ in day_patterns], dtype = object)[kinds]
+        return days + ' ' + hhmm(starts) + '-' + hhmm(starts + lengths)
+
+    times = np.full(n, 'TBA', dtype = object)
+    timed = kinds < len(day_patterns)
+    times[timed] = meetings(kinds[timed])
+    split = timed & (rng.random(n) < split_share)
+    times[split] = times[split] + '; ' + meetings(rng.integers(2, 8, size = split.sum())) #a second single-day meeting
+    tutorial = kinds == len(day_patterns) + 1
+    times[tutorial] = 'TUTORIAL ' + hhmm(np.full(tutorial.sum(), 2)) + '-' + hhmm(np.full(tutorial.sum(), 4))
+    return times + np.array(modes, dtype = object)[rng.choice(len(modes), size = n, p = mode_shares)]
+
+def synthetic_schedules(base, scale, seed = SEED):
+    ''' Returns scale copies of the sections of base (as read from the CSVs, with their Department), each copy after the
+    first with its own sections, rooms and professors, and random Times.'''
+
+    copies = [base]
+    for copy in range(1, scale):
+        copies.append(base.assign(**{'Section' : base['Section'] + f'-{copy}',
+                                     'Room' : base['Room'].str.replace(r'(?<!TBA)\s*(?=;|$)', f'.{copy}', regex = True),
+                                     'Instructor' : base['Instructor'].str.replace(r'^(?!TBA)', f'{copy}-', regex = True)}))
+    schedules = pd.concat(copies, ignore_index = True)
+    schedules['Time'] = random_times(len(schedules), np.random.default_rng(seed))
+    return schedules
+
+def measure(function, *args, repeat = REPEAT):
+    ''' Runs function(*args) repeat times and once more while tracing allocations. Returns the fastest time in seconds,
+    the peak of the memory allocated by the call in bytes, and the result of the call.'''
+
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(seconds), peak, result
+
+def run_scale(base, scale, term, repeat = REPEAT, seed = SEED):
+    ''' Times each stage on a synthetic catalog of scale copies of base. Returns one result per stage.'''
+
+    schedules = synthetic_schedules(base, scale, seed)
+    dept_csv, _, _ = load_depts()
+    dept_full_name_dict = dept_csv[['syl_link_name', 'full_name']].set_index('syl_link_name').to_dict()['full_name']
+    code_dict = load_prefixes()
+    csv = schedules.to_csv(index = False)
+
+    results = []
+    def stage(name, function, *args, rows = len(schedules)):
+        seconds, peak, result = measure(function, *args, repeat = repeat)
+        results.append({'scale' : scale, 'stage' : name, 'rows' : rows, 'seconds' : seconds,
+                        'rows_per_second' : rows / seconds if seconds > 0 else None, 'peak_mb' : peak / 2 ** 20})
+        print(f'{scale:>4}x {name:<16} {seconds * 1000:10.1f} ms {peak / 2 ** 20:10.1f} MB')
+        return result
+
+    stage('read_csv', lambda: pd.read_csv(io.StringIO(csv)))
+    masks = stage('parse_masks', parse_masks, schedules['Time'])
+    complete_list = stage('add_columns', lambda: add_columns(schedules.copy(), masks.copy()))
+    masks.flags.writeable = False
+    meetings, meeting_masks = stage('build_meetings', build_meetings, complete_list)
+    prof_index = stage('prof_index', build_prof_index, complete_list)
+    room_index = stage('room_index', build_room_index, complete_list)
+    section_index = stage('section_index', build_section_index, complete_list)
+    complete_rooms = stage('buildings', lambda: build_buildings(build_rooms(room_index)))
+    room_bldg = dict(zip(complete_rooms['Room'], complete_rooms['Building']))
+    room_occupancy = stage('occupancy', build_occupancy, meetings, meeting_masks, complete_rooms['Room'])
+    slot_bldgs = stage('slot_bldgs', build_slot_bldgs, meetings, meeting_masks, room_bldg, len(complete_list))
+    bookings = stage('double_bookings', double_bookings, complete_list, masks, meetings, meeting_masks, prof_index,
+                     complete_rooms['Room'])
+    teaching_load = stage('teaching_load', build_teaching_load, complete_list, code_dict, dept_full_name_dict)
+    links = stage('syllabus_links', syllabus_links, complete_list, *term, dept_csv['syl_link_name'][1:], code_dict)
+    catalog = Catalog('synthetic', complete_list, masks, meetings, meeting_masks, prof_index, room_index,
+                      build_rooms(room_index), complete_rooms, room_bldg, room_occupancy, bookings, slot_bldgs, teaching_load, links,
+                      *section_index)
+
+    # The checks run on every rerun, on a schedule of six sections with times
+    timed = np.flatnonzero(masks.any(axis = 1))
+    sched_masks = masks[np.random.default_rng(seed).choice(timed, size = min(6, len(timed)), replace = False)]
+    stage('open_sections', open_sections, catalog, sched_masks)
+    stage('schedule_grid', schedule_grid, meetings['Display Schedule'], meeting_masks, rows = len(meetings))
+    return results
+
+def run_benchmark(folder = BASE_FOLDER, scales = SCALES, repeat = REPEAT, seed = SEED):
+    ''' Times every stage at each scale of a snapshot folder. Returns the results with the versions they were run with.'''
+
+    base = load_schedules(folder)
+    term = snapshot_term(folder) or ('2024', '1')
+    results = []
+    for scale in scales:
+        results += run_scale(base, scale, term, repeat, seed)
+    return {'folder' : folder, 'base_rows' : len(base), 'repeat' : repeat, 'seed' : seed,
+            'time' : pd.Timestamp.now().isoformat(timespec = 'seconds'),
+            'python' : platform.python_version(), 'numpy' : np.__version__, 'pandas' : pd.__version__,
+            'machine' : platform.machine(), 'results' : results}
+
+def compare(old, new):
+    ''' Returns the times of the stages of two runs side by side, with the ratio of the new time to the old.'''
+
+    old = pd.DataFrame(old['results']).set_index(['scale', 'stage'])
+    new = pd.DataFrame(new['results']).set_index(['scale', 'stage'])
+    table = pd.DataFrame({'old (ms)' : old['seconds'] * 1000, 'new (ms)' : new['seconds'] * 1000}).dropna()
+    table['ratio'] = table['new (ms)'] / table['old (ms)']
+    return table.loc[new.index.intersection(table.index)].round(2)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Times the catalog stages on synthetic catalogs of several sizes.')
+    parser.add_argument('--folder', default = BASE_FOLDER, help = 'snapshot folder the synthetic catalogs are made from')
+    parser.add_argument('--scales', type = int, nargs = '+', default = SCALES)
+    parser.add_argument('--repeat', type = int, default = REPEAT)
+    parser.add_argument('--seed', type = int, default = SEED)
+    parser.add_argument('--output', default = 'benchmark.json')
+    parser.add_argument('--compare', help = 'JSON of an older run to compare with')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.folder, args.scales, args.repeat, args.seed)
+    with open(args.output + '.tmp', 'w') as file:
+        json.dump(report, file, indent = 1)
+    os.replace(args.output + '.tmp', args.output)
+    print(f'Results written to {args.output}')
+    if args.compare != None:
+        with open(args.compare) as file:
+            print(compare(json.load(file), report).to_string())
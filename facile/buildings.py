@@ -0,0 +1,96 @@
+''' Classifying rooms into the buildings they are in, and where the buildings are.'''
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from facile.timeslots import NDAYS, NSLOTS, unpack
+
+# Room -> building shortcuts for rooms whose names do not start with the building
+bldg_dict = {
+    'Arete' : ['ABS CBN CORPORATION INNOVATION CLASSROOM', 'ART GAL',
+               'BLACK BOX THEATER FA', 'BRAZIER KITCHEN',
+               'CO BUN TING AND PO TY LEE CO MAC LAB', "COLLEGE '66 CO-LAB", 'FA DEPT',
+               'INNOVATION 201', 'INNOVATION 202', 'JOSEPH AND GEMMA TANBUNTIONG STUDIO',
+               'NATIONAL BOOKSTORE ATELIER', 'YAO SIU LUN MAC LAB'],
+    'C' : ['CH DEPT'],
+    'CTC' : ['HSC DEPT'],
+    'DLC' : ['EN DEPT', 'FIL DEPT', 'IS DEPT', 'PH DEPT', 'TH DEPT'],
+    'F' : ['CS DEPT', 'PS DEPT'],
+    'LH' : ['DS DEPT', 'EC DEPT', 'EU DEPT', 'JSP OFFICE', 'POS DEPT'],
+    'MO' : ['ES DEPT'],
+    'PE Complex' : ['COV COURTS', 'DANCE AREA', 'LS POOL', 'MARTIAL ARTS CE',
+                    'MARTIAL ARTS RM', 'MULTI-PUR RM', 'TAB TEN AREA', 'TENNIS CRT', 'WEIGHTS GYM'],
+    'SEC-A' : ['BIO DEPT', 'MA DEPT'],
+    'SOM' : ['L&S DEPT', 'QMIT OFFICE'],
+    'SS' : ['COM STUD', 'CORD TRNG RM', 'GROUP THERAPY RM', 'PSY COMP RM']
+}
+room_bldg_dict = {room : bldg for bldg, rooms in bldg_dict.items() for room in rooms}
+
+# The building at the start of the other room names; the first alternative that matches wins
+bldg_pattern = re.compile(r'^((?:B|BEL|C|F|G|K)(?=-.)' # Bldg-Room
+                          r'|SEC-[ABC](?=.)' # SEC-XRoom
+                          r'|(?:BEL|CTC|LH|SOM|SS)(?=.)' # Bldg Room; BEL 211 is anomalous
+                          r'|FA ANNEX(?= .))')
+
+# Building, abbreviation, latitude and longitude; the number of a building on the map is its position here
+bldg_coords = [
+    ['Arete', 'Arete', 14.6415, 121.0754],
+    ['Bellarmine', 'BEL', 14.6418, 121.0797],
+    ['Berchmans', 'B', 14.6395, 121.0785],
+    ['PLDT-Convergent Technologies Center' ,'CTC', 14.6383, 121.0764],
+    ['De La Costa', 'DLC', 14.6401, 121.0766],
+    ['Faura', 'F', 14.6397, 121.0766],
+    ['Gonzaga', 'G', 14.6391, 121.0782],
+    ['Kostka', 'K', 14.6398, 121.0781],
+    ['Leong Hall', 'LH', 14.6408, 121.0763],
+    ['Manila Observatory', 'MO', 14.6358, 121.0777],
+    ['PE Complex', 'PE Complex', 14.6373, 121.0786],
+    ['Schmitt', 'C', 14.6392, 121.0774],
+    ['Science Education Complex A', 'SEC A', 14.6383, 121.0778],
+    ['Science Education Complex B', 'SEC B', 14.6380, 121.0772],
+    ['Science Education Complex C', 'SEC C', 14.6380, 121.0767],
+    ['School of Management', 'SOM', 14.6385, 121.0762],
+    ['Social Sciences', 'SS', 14.6407, 121.0767],
+]
+bldg_codes = [abbreviation.replace('SEC ', 'SEC-') for _, abbreviation, _, _ in bldg_coords] #as classify_rooms names them
+
+def classify_rooms(rooms):
+    ''' Returns the building of each room of a Series of rooms. Rooms that are neither shortcuts nor start with a known
+    building are their own building.'''
+
+    rooms = pd.Series(rooms, dtype = object)
+    return rooms.map(room_bldg_dict).fillna(rooms.str.extract(bldg_pattern, expand = False)).fillna(rooms)
+
+def build_buildings(room_unique):
+    ''' Returns the room table with the building each room is in.'''
+
+    complete_rooms = room_unique.copy()
+    complete_rooms['Building'] = classify_rooms(complete_rooms['Room'])
+    return complete_rooms
+
+def bldg_number(bldg):
+    ''' Returns the number of a building (as classified by classify_rooms) on the map, or None if it is not on it.'''
+
+    return bldg_codes.index(bldg) + 1 if bldg in bldg_codes else None
+
+def bldg_location(bldg):
+    ''' Returns the latitude and longitude of a building (as classified by classify_rooms), or None if it is not on the map.'''
+
+    return tuple(bldg_coords[bldg_codes.index(bldg)][2:]) if bldg in bldg_codes else None
+
+def walking_order(meetings, meeting_masks, room_bldg):
+    ''' Returns one row per day of each meeting (rows of catalog.meetings and their masks) in the order they are attended:
+    the Day (M = 0), the Start and End slots of the day (End is the first free slot after it), the Building of its room
+    (None for rooms without one, such as TBA) and its Display Schedule.'''
+
+    slot_array = unpack(meeting_masks).reshape(-1, NDAYS, NSLOTS)
+    meeting_index, days = np.nonzero(slot_array.any(axis = -1))
+    on_day = slot_array[meeting_index, days]
+    order = pd.DataFrame({'Day' : days,
+                          'Start' : on_day.argmax(axis = -1),
+                          'End' : NSLOTS - on_day[:, ::-1].argmax(axis = -1),
+                          'Building' : [room_bldg.get(room) for room in meetings['Room'].to_numpy()[meeting_index]],
+                          'Display Schedule' : meetings['Display Schedule'].to_numpy()[meeting_index]})
+    return order.sort_values(['Day', 'Start'], kind = 'stable', ignore_index = True)
@@ -0,0 +1,74 @@
+''' The campus map of the Map tab: the numbered buildings rendered once, and overlays of highlighted buildings and
+walking routes added to the rendered page with a small script, without rendering the map again.'''
+
+import json
+
+import folium
+import pandas as pd
+
+from facile.buildings import bldg_coords, bldg_location
+from facile.grid import day_names
+
+MAP_WIDTH = 700
+MAP_HEIGHT = 500
+
+day_colors = ['#e41a1c', '#377eb8', '#4daf4a', '#984ea3', '#ff7f00', '#a65628'] #of the routes from M to S
+
+def base_map():
+    ''' Returns the folium map of the campus with a numbered marker for each building of bldg_coords.'''
+
+    bldg_coords_df = pd.DataFrame(bldg_coords, columns = ['Building', 'Abbreviation', 'Latitude', 'Longitude'])
+    m = folium.Map(location = [bldg_coords_df['Latitude'].mean(), bldg_coords_df['Longitude'].mean()], zoom_start = 17.25, min_zoom = 16, max_zoom = 20)
+    for i, (bldg, abbreviation, latitude, longitude) in enumerate(bldg_coords):
+        folium.Marker([latitude, longitude],
+                      popup = bldg + ' (' + abbreviation + ')',
+                      icon = folium.DivIcon(html = f'''<div><svg>
+    <circle cx='20' cy='30' r='20' fill='#add8e6' opacity='1'/>
+    <text x='15' y='30' fill='black'>{i+1}</text>
+    </svg></div>''')).add_to(m)
+    return m
+
+def render_base_map():
+    ''' Renders the base map into a standalone HTML page, as streamlit_folium.folium_static would. Returns the page and
+    the name of the map's Leaflet variable in it, which overlays add their layers to.'''
+
+    m = base_map()
+    return folium.Figure().add_child(m).render(), m.get_name()
+
+def route_points(order):
+    ''' Returns the routes of a walking order (see facile.buildings.walking_order): for each day with classes in at least
+    two buildings on the map, its color, a label and the locations of the buildings in the order they are walked to.'''
+
+    routes = []
+    for day, classes in order.groupby('Day', sort = True):
+        bldgs = [bldg for bldg in classes['Building'] if bldg_location(bldg) != None]
+        bldgs = [bldg for i, bldg in enumerate(bldgs) if i == 0 or bldg != bldgs[i-1]] #staying in a building is not a walk
+        if len(bldgs) >= 2:
+            routes.append({'color' : day_colors[day],
+                           'label' : day_names[day] + ': ' + ' → '.join(bldgs),
+                           'points' : [bldg_location(bldg) for bldg in bldgs]})
+    return routes
+
+def overlay_script(map_name, highlights = (), routes = ()):
+    ''' Returns a script that adds a circle around each highlighted building (a list of building names as classified by
+    classify_rooms) and the lines of the routes (see route_points) to the map named map_name.'''
+
+    points = [{'location' : bldg_location(bldg), 'label' : bldg} for bldg in dict.fromkeys(highlights)
+              if bldg_location(bldg) != None]
+    return f'''<script>
+(function() {{
+    var overlay = {json.dumps({'points' : points, 'routes' : list(routes)})};
+    overlay.points.forEach(function(point) {{
+        L.circleMarker(point.location, {{radius: 24, color: '#e41a1c', weight: 4, fill: false}}).bindTooltip(point.label).addTo({map_name});
+    }});
+    overlay.routes.forEach(function(route) {{
+        L.polyline(route.points, {{color: route.color, weight: 4, opacity: 0.8}}).bindTooltip(route.label).addTo({map_name});
+    }});
+}})();
+</script>'''
+
+def with_overlay(page, script):
+    ''' Returns the rendered map page with an overlay script run after the map is set up.'''
+
+    end = page.rfind('</html>')
+    return page[:end] + script + '\n' + page[end:] if end >= 0 else page + script
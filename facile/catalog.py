@@ -0,0 +1,190 @@
+''' Loading a schedules snapshot folder into the catalog shared by every page of FACILE.'''
+
+import hashlib
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+
+from facile.buildings import build_buildings
+from facile.conflicts import double_bookings
+from facile.indexes import build_prof_index, build_room_index, build_section_index
+from facile.meetings import build_meetings
+from facile.occupancy import build_occupancy
+from facile.professors import build_teaching_load
+from facile.snapshot import categorical_columns, read_snapshot, source_digest, write_snapshot
+from facile.syllabi import snapshot_term, syllabus_links
+from facile.timings import stage
+from facile.timeslots import early_mask, late_mask, overlaps, parse_masks, slot_lists
+from facile.walking import build_slot_bldgs
+
+DEPTS_CSV = 'depts.csv'
+PREFIXES_CSV = 'prefixes.csv'
+MAX_CACHED_DEPARTMENTS = 200
+
+logger = logging.getLogger(__name__)
+department_cache = {} # digest of a department CSV -> its rows, shared by the snapshots that have the same CSV
+
+@dataclass(frozen = True)
+class Catalog:
+    ''' Everything derived from one snapshot folder. The catalog is shared by all sessions, so treat it as read-only:
+    filter or copy the frames before adding columns to them.'''
+
+    folder: str
+    complete_list: pd.DataFrame
+    masks: np.ndarray # the timeslot masks of the rows of complete_list
+    meetings: pd.DataFrame # one row per meeting of each section
+    meeting_masks: np.ndarray # the timeslot masks of the rows of meetings
+    prof_index: Mapping # professor -> rows of complete_list
+    room_index: Mapping # room -> rows of complete_list
+    room_unique: pd.DataFrame
+    complete_rooms: pd.DataFrame # the rooms and their buildings
+    room_bldg: Mapping # room -> building
+    room_occupancy: np.ndarray # whether each room of complete_rooms is in use at each of the 180 timeslots
+    double_bookings: pd.DataFrame # the rooms and professors booked twice at the same time (see facile.conflicts)
+    slot_bldgs: np.ndarray # the building of each timeslot of each row of complete_list (see facile.walking)
+    teaching_load: pd.DataFrame
+    syllabus_links: pd.Series # the syllabus link of each row of complete_list (None if the folder has no term)
+    dept_subjects: Mapping # department -> its subjects (Subject Code and Name)
+    subject_sections: Mapping # (department, subject) -> its sections
+    section_row: Mapping # (department, subject, section) -> the first row of complete_list with them
+
+def snapshot_key(folder):
+    ''' Returns the (file name, modification time) pairs of the CSVs in a snapshot folder, to be used as a cache key.'''
+
+    names = sorted(name for name in os.listdir(folder) if name.endswith('.csv'))
+    return tuple((name, os.stat(os.path.join(folder, name)).st_mtime_ns) for name in names)
+
+def load_depts():
+    ''' Returns the department table, the short names of the departments with CSVs, and the sorted full names.'''
+
+    dept_csv = pd.read_csv(DEPTS_CSV)
+    dept_short_names = dept_csv['short_name'][:-4]
+    dept_full_names = dept_csv['full_name'].sort_values()
+    return dept_csv, dept_short_names, dept_full_names
+
+def load_prefixes():
+    ''' Returns the dictionary from catalog code prefixes to the department codes used in syllabus links.'''
+
+    code_csv = pd.read_csv(PREFIXES_CSV, index_col = [0])
+    return code_csv.to_dict()['syl_link_name']
+
+def override_departments(complete_list):
+    ''' Moves the elective core subjects into their own departments, as listed in the Help tab.'''
+
+    complete_list.loc[complete_list['Subject Code'].str.contains('PHILO 11.0'), 'Department'] = 'Philosophy: The Human Condition (PHILO 11)'
+    complete_list.loc[complete_list['Subject Code'].str.contains('ENE 13.0'), 'Department'] = 'Interdisciplinary Elective 1 - English (IE 1)'
+    complete_list.loc[complete_list['Subject Code'].isin(['BIO 10.01', 'BIO 10.02', 'BIO 11.01', 'BIO 11.02', 'BIO 12.01', 'BIO 12.02',
+                                                          'CHEM 10.01', 'CHEM 10.02', 'ENVI 10.01', 'ENVI 10.02',
+                                                          'PHYS 10.01', 'PHYS 10.02']), 'Department'] = 'Natural Science (NatSc 10)'
+    complete_list.loc[complete_list['Subject Code'].isin(['CSP 11', 'FRE 11', 'GER 11', 'ITA 11', 'JPN 11', 'KRN 11', 'RUSS 11', 'SPA 11']),
+                      'Department'] = 'Foreign Language and Culture (FLC 11)'
+    return complete_list
+
+def read_department(path):
+    ''' Reads a department CSV, reusing the rows read from a CSV with the same contents before (usually the same
+    department in an older snapshot). Returns None for an empty CSV.'''
+
+    with open(path, 'rb') as file:
+        key = hashlib.sha256(file.read()).hexdigest()
+    department = department_cache.pop(key, False)
+    if department is False:
+        try:
+            department = pd.read_csv(path)
+        except EmptyDataError:
+            department = None
+    department_cache[key] = department #most recently used last
+    while len(department_cache) > MAX_CACHED_DEPARTMENTS:
+        department_cache.pop(next(iter(department_cache)), None)
+    return department
+
+def load_schedules(folder):
+    ''' Reads every department CSV in the folder and concatenates them, with the department's full name attached.
+    Only the CSVs that changed since they were last read are parsed.'''
+
+    _, dept_short_names, dept_full_names = load_depts()
+    df_list = []
+    for i in range(len(dept_short_names)):
+        df = read_department(os.path.join(folder, dept_short_names[i] + '.csv'))
+        if df is not None:
+            df_list.append(df.assign(Department = dept_full_names[i]))
+    return pd.concat(df_list, ignore_index = True)
+
+def build_complete_list(folder):
+    ''' Builds the catalog of all sections with their display strings, departments, and early / late flags,
+    and the timeslot masks of the sections.'''
+
+    complete_list = load_schedules(folder)
+    masks = parse_masks(complete_list['Time'])
+    return add_columns(complete_list, masks), masks
+
+def add_columns(complete_list, masks):
+    ''' Adds the display strings, the overridden departments and the early / late flags to the sections read from the
+    CSVs, given their timeslot masks, and makes the masks read-only. The department, instructor and room are kept as
+    categoricals, which share one string per value among the rows.'''
+
+    complete_list['Modified Schedule'] = slot_lists(masks)
+    complete_list['Subject Code and Name'] = complete_list['Subject Code'] + ': ' + complete_list['Course Title']
+    complete_list['Display Schedule'] = complete_list['Subject Code'] + ' ' + complete_list['Section'] + ' (' + complete_list['Room'] + ')'
+    complete_list = override_departments(complete_list)
+    complete_list['is_early'] = overlaps(masks, early_mask)
+    complete_list['is_late'] = overlaps(masks, late_mask)
+    for column in categorical_columns:
+        complete_list[column] = complete_list[column].astype('category')
+
+    masks.flags.writeable = False
+    return complete_list
+
+def load_complete_list(folder):
+    ''' Returns the complete list of a snapshot folder and its timeslot masks, from the folder's columnar file when it is
+    up to date with the CSVs (see facile.snapshot), and built from the CSVs otherwise, writing the file for next time.'''
+
+    snapshot = read_snapshot(folder)
+    if snapshot != None: return snapshot
+    digest = source_digest(folder)
+    complete_list, masks = build_complete_list(folder)
+    try:
+        write_snapshot(folder, complete_list, masks, digest)
+    except OSError as error: #e.g. a read-only folder; the CSVs are read again next time
+        logger.warning('Could not write the columnar file of %s: %s', folder, error)
+    return complete_list, masks
+
+def build_rooms(room_index):
+    ''' Returns the sorted unique rooms (without TBA) from the room index.'''
+
+    return pd.DataFrame({'Room' : sorted(room for room in room_index if room != 'TBA')})
+
+def load_catalog(folder):
+    ''' Loads a snapshot folder and builds the catalog and its derived tables.'''
+
+    with stage('complete list'):
+        complete_list, masks = load_complete_list(folder)
+    with stage('meetings'):
+        meetings, meeting_masks = build_meetings(complete_list)
+    with stage('indexes'):
+        prof_index = build_prof_index(complete_list)
+        room_index = build_room_index(complete_list)
+        dept_subjects, subject_sections, section_row = build_section_index(complete_list)
+    with stage('rooms'):
+        room_unique = build_rooms(room_index)
+        complete_rooms = build_buildings(room_unique)
+        room_bldg = dict(zip(complete_rooms['Room'], complete_rooms['Building']))
+        room_occupancy = build_occupancy(meetings, meeting_masks, complete_rooms['Room'])
+        slot_bldgs = build_slot_bldgs(meetings, meeting_masks, room_bldg, len(complete_list))
+    with stage('double bookings'):
+        bookings = double_bookings(complete_list, masks, meetings, meeting_masks, prof_index, complete_rooms['Room'])
+
+    dept_csv, _, _ = load_depts()
+    dept_full_name_dict = dept_csv[['syl_link_name', 'full_name']].set_index('syl_link_name').to_dict()['full_name']
+    code_dict = load_prefixes()
+    with stage('teaching load'):
+        teaching_load = build_teaching_load(complete_list, code_dict, dept_full_name_dict)
+    with stage('syllabus links'):
+        term = snapshot_term(folder)
+        links = syllabus_links(complete_list, *term, dept_csv['syl_link_name'][1:], code_dict) if term != None else None
+    return Catalog(folder, complete_list, masks, meetings, meeting_masks, prof_index, room_index, room_unique, complete_rooms,
+                   room_bldg, room_occupancy, bookings, slot_bldgs, teaching_load, links, dept_subjects, subject_sections, section_row)
@@ -0,0 +1,99 @@
+''' Checking sections of the catalog against a user's schedule, and the catalog against itself for rooms and professors
+booked twice at the same time. Run
+
+    python -m facile.conflicts <folder> [output.csv]
+
+to list the double bookings of a snapshot folder.'''
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from facile.timeslots import NDAYS, NSLOTS, combine, has_overlap, overlaps, unpack
+
+booking_columns = ['Kind', 'Booked', 'Subject Code 1', 'Section 1', 'Time 1', 'Subject Code 2', 'Section 2', 'Time 2',
+                   'Overlap (min)']
+
+def open_sections(catalog, sched_masks, condition = None):
+    ''' Returns a boolean Series aligned to complete_list that is True for the sections that do not overlap with
+    the schedule made of sched_masks, optionally restricted to the rows where condition is True.
+    A schedule that already has overlaps leaves no section open.'''
+
+    if has_overlap(sched_masks):
+        is_open = np.zeros(len(catalog.masks), dtype = bool)
+    else:
+        is_open = ~overlaps(catalog.masks, combine(sched_masks))
+    is_open = pd.Series(is_open, index = catalog.complete_list.index)
+    if condition is not None:
+        is_open &= condition
+    return is_open
+
+def shared_slot_pairs(resources, masks):
+    ''' Returns the pairs (i, j), i < j, of the entries that have the same resource and share a timeslot, given the
+    resource id and the timeslot mask of each entry, with the number of timeslots they share.'''
+
+    entries, slots = np.nonzero(unpack(masks).reshape(-1, NDAYS * NSLOTS))
+    keys = np.asarray(resources, dtype = np.int64)[entries] * (NDAYS * NSLOTS) + slots
+    order = np.argsort(keys, kind = 'stable')
+    entries, keys = entries[order], keys[order]
+
+    # Each entry pairs with the entries after it that have the same resource and timeslot
+    group_ends = np.searchsorted(keys, keys, 'right')
+    partners = group_ends - np.arange(len(keys)) - 1
+    first = np.repeat(np.arange(len(keys)), partners)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners)
+    pairs = np.sort(np.stack([entries[first], entries[second]], axis = 1), axis = 1)
+    pairs, counts = np.unique(pairs[pairs[:, 0] != pairs[:, 1]].reshape(-1, 2), axis = 0, return_counts = True)
+    return pairs, counts
+
+def double_bookings(complete_list, masks, meetings, meeting_masks, prof_index, rooms):
+    ''' Returns every pair of sections held in one of rooms, or taught by the same professor of prof_index, at
+    overlapping times, with the number of minutes they overlap, from the sections of the catalog and their meetings.
+    The same class listed in all_ies and in its home department is not a double booking, so pairs of rows with the
+    same Subject Code and Section are left out.'''
+
+    tables = []
+
+    # Rooms, per meeting, since a section can meet in different rooms at different times
+    meeting_rooms = meetings['Room'].reset_index(drop = True).str.split(';').explode().str.strip()
+    meeting_rooms = meeting_rooms[meeting_rooms.isin(rooms)] #TBA is not a room
+    room_ids, room_names = pd.factorize(meeting_rooms)
+    pairs, counts = shared_slot_pairs(room_ids, meeting_masks[meeting_rooms.index.to_numpy()])
+    rows = meetings['Row'].to_numpy()[meeting_rooms.index.to_numpy()]
+    tables.append(('Room', room_names.to_numpy()[room_ids[pairs[:, 0]]], rows[pairs], counts))
+
+    # Professors, per section
+    profs = [(prof, row) for prof, prof_rows in prof_index.items() if not prof.startswith('TBA') for row in prof_rows]
+    prof_ids, prof_names = pd.factorize(pd.Series([prof for prof, _ in profs], dtype = object))
+    prof_rows = np.array([row for _, row in profs], dtype = np.int64)
+    pairs, counts = shared_slot_pairs(prof_ids, masks[prof_rows])
+    tables.append(('Instructor', prof_names.to_numpy()[prof_ids[pairs[:, 0]]], prof_rows[pairs], counts))
+
+    codes = complete_list['Subject Code'].to_numpy()
+    sections = complete_list['Section'].to_numpy()
+    times = complete_list['Time'].to_numpy()
+    bookings = []
+    for kind, booked, row_pairs, counts in tables:
+        first, second = row_pairs[:, 0], row_pairs[:, 1]
+        # List each pair of classes once, in the order of their subject codes and sections
+        swap = (codes[first] > codes[second]) | ((codes[first] == codes[second]) & (sections[first] > sections[second]))
+        first, second = np.where(swap, second, first), np.where(swap, first, second)
+        bookings.append(pd.DataFrame({'Kind' : kind, 'Booked' : booked,
+                                      'Subject Code 1' : codes[first], 'Section 1' : sections[first], 'Time 1' : times[first],
+                                      'Subject Code 2' : codes[second], 'Section 2' : sections[second], 'Time 2' : times[second],
+                                      'Overlap (min)' : counts * 30}))
+    bookings = pd.concat(bookings, ignore_index = True)
+    bookings = bookings[(bookings['Subject Code 1'] != bookings['Subject Code 2']) | (bookings['Section 1'] != bookings['Section 2'])]
+    bookings = bookings.drop_duplicates(booking_columns[:-1]) #the all_ies and home department rows of the same classes
+    return bookings.sort_values(booking_columns[:6], kind = 'stable', ignore_index = True)
+
+if __name__ == '__main__':
+    from facile.catalog import load_catalog
+
+    folder = sys.argv[1]
+    bookings = load_catalog(folder).double_bookings
+    output = sys.argv[2] if len(sys.argv) > 2 else os.path.basename(os.path.normpath(folder)) + '_double_bookings.csv'
+    bookings.to_csv(output, index = False)
+    print(f'{(bookings["Kind"] == "Room").sum()} room and {(bookings["Kind"] == "Instructor").sum()} instructor double bookings written to {output}')
@@ -0,0 +1,53 @@
+''' Comparing two schedules snapshots section by section.'''
+
+import os
+
+import numpy as np
+import pandas as pd
+
+key_columns = ['Subject Code', 'Section']
+compared_columns = ['Time', 'Room', 'Instructor', 'Free Slots']
+
+def snapshot_folders(root = '.'):
+    ''' Returns the sorted names of the snapshot folders (schedules_*) in root.'''
+
+    return sorted(name for name in os.listdir(root) if name.startswith('schedules') and os.path.isdir(os.path.join(root, name)))
+
+def unique_sections(complete_list):
+    ''' Returns one row per (Subject Code, Section). Interdisciplinary electives are listed both in all_ies and in their
+    home department, which comes later in the complete list, so the last row is kept. Categorical columns become plain
+    strings, since the categories of two snapshots differ.'''
+
+    sections = complete_list[key_columns + compared_columns].drop_duplicates(key_columns, keep = 'last')
+    return sections.astype({column : object for column in sections if isinstance(sections[column].dtype, pd.CategoricalDtype)})
+
+def diff_snapshots(old_list, new_list):
+    ''' Compares the complete lists of two snapshots on (Subject Code, Section) and returns one row per section that was
+    added, removed or changed, with its Status, which of Time, Room, Instructor and Free Slots changed, their old and
+    new values, and the change in Free Slots.'''
+
+    old = unique_sections(old_list)
+    new = unique_sections(new_list)
+    merged = pd.merge(old, new, on = key_columns, how = 'outer', suffixes = (' (old)', ' (new)'), indicator = True, sort = False)
+    both = (merged['_merge'] == 'both').to_numpy()
+
+    changed = pd.DataFrame({column : both & (merged[column + ' (old)'] != merged[column + ' (new)']).to_numpy()
+                                         & (merged[column + ' (old)'].notna() | merged[column + ' (new)'].notna()).to_numpy()
+                            for column in compared_columns})
+    status = np.select([merged['_merge'] == 'right_only', merged['_merge'] == 'left_only', changed.any(axis = 1)],
+                       ['Added', 'Removed', 'Changed'], '')
+
+    diff = merged[key_columns].copy()
+    diff['Status'] = status
+    changes = pd.Series('', index = merged.index)
+    for column in compared_columns:
+        changes += np.where(changed[column], ', ' + column, '')
+    diff['Changes'] = changes.str[2:]
+    for column in compared_columns:
+        diff[column + ' (old)'] = merged[column + ' (old)']
+        diff[column + ' (new)'] = merged[column + ' (new)']
+    diff['Free Slots Delta'] = merged['Free Slots (new)'] - merged['Free Slots (old)']
+
+    diff = diff[diff['Status'] != ''].sort_values(key_columns, kind = 'stable')
+    return diff.astype({'Free Slots (old)' : 'Int64', 'Free Slots (new)' : 'Int64', 'Free Slots Delta' : 'Int64'})\
+               .reset_index(drop = True)
@@ -0,0 +1,247 @@
+''' Generating every combination of sections without overlaps for a list of subjects, and ranking them by preferences.'''
+
+import heapq
+import itertools
+
+import numpy as np
+
+from facile.timeslots import NDAYS, NSLOTS, campus_days, day_set, empty_mask, gap_slots, mask_ints, unpack_int
+from facile.walking import NO_CLASS, UNKNOWN_BLDG, layout_walks
+
+# Penalties of the ranking: per early / late / Filipino class, per free half hour between classes, per day on campus,
+# per 100 meters walked between classes, and per tight transfer between back-to-back classes
+default_weights = {'early' : 2, 'late' : 2, 'filipino' : 0, 'gaps' : 0.5, 'days' : 3, 'walking' : 1, 'tight' : 2}
+
+def section_options(catalog, subjects, fixed_mask = empty_mask):
+    ''' For each (department, subject code and name) pair, returns a dictionary from the timeslots of its sections
+    (as integers) to the row ids of the sections with those timeslots, leaving out sections that overlap with fixed_mask.'''
+
+    complete_list = catalog.complete_list
+    fixed = mask_ints(fixed_mask)[0]
+    options = []
+    for dept, subj in subjects:
+        rows = np.flatnonzero((complete_list['Department'] == dept) & (complete_list['Subject Code and Name'] == subj))
+        groups = {}
+        for row, mask in zip(rows.tolist(), mask_ints(catalog.masks[rows])):
+            if mask & fixed == 0:
+                groups.setdefault(mask, []).append(row)
+        options.append(groups)
+    return options
+
+def generate_schedules(catalog, subjects, fixed_mask = empty_mask, limit = 100):
+    ''' Lazily yields up to limit combinations of sections without overlaps for subjects, a list of
+    (department, subject code and name) pairs, as tuples of row ids of complete_list in the order of subjects.
+    Sections that overlap with fixed_mask (e.g. the sections already chosen) are skipped.
+
+    Sections with the same timeslots are searched once. Subjects with the fewest options are placed first, and a
+    choice is dropped as soon as it leaves a later subject with no section that fits.'''
+
+    options = section_options(catalog, subjects, fixed_mask)
+    order = sorted(range(len(options)), key = lambda i: len(options[i]))
+    choices = [list(options[i].items()) for i in order]
+    original_order = np.argsort(order)
+
+    def search(depth, used, picked):
+        if depth == len(choices):
+            yield picked
+            return
+        for mask, rows in choices[depth]:
+            if mask & used: continue
+            new_used = used | mask
+            if all(any(m & new_used == 0 for m, _ in choices[k]) for k in range(depth + 1, len(choices))):
+                yield from search(depth + 1, new_used, picked + [rows])
+
+    if len(subjects) == 0 or limit < 1: return
+    count = 0
+    for picked in search(0, mask_ints(fixed_mask)[0], []):
+        for rows in itertools.product(*picked):
+            yield tuple(rows[i] for i in original_order)
+            count += 1
+            if count >= limit: return
+
+def next_to(classes, open_slots):
+    ''' Returns which of the timeslots of classes, boolean arrays of shape (180,), come right before or after a slot of
+    open_slots on the same day, with no class between them.'''
+
+    slots = np.arange(NDAYS * NSLOTS).reshape(NDAYS, NSLOTS)
+    classes, open_slots = classes.reshape(NDAYS, NSLOTS), open_slots.reshape(NDAYS, NSLOTS)
+    before = np.maximum.accumulate(np.where(classes, slots, -1), axis = 1)[open_slots]
+    after = np.minimum.accumulate(np.where(classes, slots, NDAYS * NSLOTS)[:, ::-1], axis = 1)[:, ::-1][open_slots]
+    result = np.zeros(NDAYS * NSLOTS + 1, dtype = bool)
+    result[before] = True
+    result[after] = True
+    return result[:-1] #before is -1 and after is NDAYS * NSLOTS when there is no such class
+
+def rank_schedules(catalog, subjects, fixed_mask = empty_mask, k = 10, weights = {}, fixed_rows = ()):
+    ''' Returns the k schedules without overlaps with the lowest scores, as (score, rows) pairs from best to worst, where
+    rows are the row ids of complete_list in the order of subjects. The score adds weights['early'], weights['late'] and
+    weights['filipino'] for each early, late, and Filipino section chosen (a negative weight prefers them), then
+    weights['gaps'] for each free half hour between classes on the same day and weights['days'] for each day with classes,
+    counting the fixed_mask too. Missing weights take their values from default_weights.
+    weights['walking'] is added per 100 meters walked between consecutive classes of a day and weights['tight'] per
+    tight transfer (see facile.walking), counting the classes of fixed_rows, the row ids of the sections already chosen.
+
+    This is a branch and bound over the same search as generate_schedules: a partial schedule is dropped once its
+    lower bound is no better than the kth best score so far. The bound adds the cost of the sections so far, the
+    cheapest section that still fits for each remaining subject, the days used so far plus the most new days any one
+    remaining subject needs, and the gaps that no section that still fits can fill.
+
+    When walking counts, the sections with the same timeslots in different buildings are searched together: each state
+    of the search holds every layout of rooms that reaches it, and the bound of each layout also adds its walks so far,
+    except those that a section left in a room off the map could shorten. A layout is dropped when k others with the
+    same buildings next to the timeslots still open are better, or when the lowest score added below the same state
+    with those buildings, as found before, cannot beat the kth best.'''
+
+    weights = {**default_weights, **weights}
+    if weights['gaps'] < 0 or weights['days'] < 0 or weights['walking'] < 0 or weights['tight'] < 0:
+        raise ValueError('The weights of gaps, days, walking and tight transfers cannot be negative.')
+    walking = weights['walking'] > 0 or weights['tight'] > 0
+
+    complete_list = catalog.complete_list
+    row_costs = (weights['early'] * complete_list['is_early'].to_numpy() + weights['late'] * complete_list['is_late'].to_numpy()
+                 + weights['filipino'] * (complete_list['Lang'] == 'FIL').to_numpy())
+
+    choices = []
+    for groups in section_options(catalog, subjects, fixed_mask):
+        options = []
+        for mask, rows in groups.items():
+            alike = {} #the sections with these timeslots that cost the same, and are in the same buildings if walking counts
+            for row in rows:
+                alike.setdefault((float(row_costs[row]), catalog.slot_bldgs[row].tobytes() if walking else b''), []).append(row)
+            variants = sorted(alike.items())
+            costs = np.array([cost for (cost, _), _ in variants])
+            bldgs = catalog.slot_bldgs[[rows[0] for _, rows in variants]] if walking else None
+            options.append((costs.min(), mask, day_set(mask), (costs, [rows for _, rows in variants], bldgs)))
+        choices.append(sorted(options, key = lambda option: option[:2]))
+    order = sorted(range(len(choices)), key = lambda i: len(choices[i]))
+    choices = [choices[i] for i in order]
+    original_order = np.argsort(order)
+    if len(subjects) == 0 or k < 1 or any(len(options) == 0 for options in choices): return []
+
+    n = len(choices)
+    best = [] #heap of (-score, count, rows), so that the worst of the k best is on top
+    counter = itertools.count()
+    bounds = {} #(depth, timeslots used) -> (lower bound of the score added by the subjects left, free timeslots they can take)
+    off_map_cache = {}
+    proven = {} #(depth, timeslots used) -> {buildings next to the open timeslots : lower bound of the score added by any completion}
+
+    def bound(depth, used):
+        ''' Returns the lower bound of the score, other than the cost of the sections so far and the walks, of the
+        schedules with the timeslots used that complete the subjects from depth (None if there are none), and the
+        timeslots that the sections left can take.'''
+
+        if (depth, used) in bounds: return bounds[(depth, used)]
+        used_days = day_set(used)
+        rest_cost, new_days, reach = 0, 0, 0
+        for options in choices[depth:]:
+            fits = [(c, (days & ~used_days).bit_count()) for c, mask, days, _ in options if mask & used == 0]
+            if fits == []:
+                bounds[(depth, used)] = None, None
+                return bounds[(depth, used)]
+            rest_cost += fits[0][0] #the options are sorted by cost
+            new_days = max(new_days, min(days for _, days in fits))
+            for _, mask, _, _ in options:
+                if mask & used == 0: reach |= mask
+        bounds[(depth, used)] = (rest_cost + weights['days'] * (used_days.bit_count() + new_days)
+                                 + weights['gaps'] * (gap_slots(used) & ~reach).bit_count(), unpack_int(reach))
+        return bounds[(depth, used)]
+
+    def off_map(depth, used):
+        ''' Returns the free timeslots that the sections left that fit can take in a room that is not on the map. As
+        the straight-line distances between buildings follow the triangle inequality, adding classes between two others
+        on the map never shortens the walk between them, but adding one off the map (0 meters to and from) can.'''
+
+        if (depth, used) not in off_map_cache:
+            taken = [bldgs for options in choices[depth:] for _, mask, _, (_, _, bldgs) in options if mask & used == 0]
+            off_map_cache[(depth, used)] = (np.concatenate(taken) == UNKNOWN_BLDG).any(axis = 0) if taken else None
+        return off_map_cache[(depth, used)]
+
+    def walks(bldgs, open_slots):
+        ''' Returns the score of the walks between the classes of each timetable of an (s, 180) array of the buildings
+        of their timeslots, leaving out the walks over the open_slots.'''
+
+        distances, tight = layout_walks(bldgs, open_slots)
+        return weights['walking'] * distances / 100 + weights['tight'] * tight
+
+    def threshold():
+        return -best[0][0] if len(best) == k else float('inf')
+
+    def push(score, candidates):
+        ''' Adds the complete schedules with the given score to the k best.'''
+
+        for rows in candidates:
+            if len(best) < k:
+                heapq.heappush(best, (-score, next(counter), rows))
+            elif score < -best[0][0]:
+                heapq.heapreplace(best, (-score, next(counter), rows))
+            else:
+                break
+
+    def paid(depth, used, costs, bldgs):
+        ''' Returns the cost of the sections of each partial schedule with the timeslots used, with the least score the
+        walks to their classes can add if walking counts.'''
+
+        return costs + walks(bldgs, off_map(depth, used)) if walking else costs
+
+    def search(depth, used, costs, picks, bldgs, paid_so_far):
+        ''' Adds the schedules that complete the partial schedules with the timeslots used to the k best. The partial
+        schedules differ in their sections: costs holds the cost of the sections of each, picks their choices, bldgs the
+        buildings of their timeslots if walking counts, and paid_so_far their paid scores. Returns the lowest score among
+        the completions of each (or the threshold of the k best if that is lower), which bounds every completion of it.'''
+
+        rest, open_slots = bound(depth, used)
+        lows = paid_so_far + rest
+        kept = np.flatnonzero(lows < threshold())
+        if len(kept) == 0: return lows
+
+        # The score that the completions add only depends on the buildings of the classes next to the open timeslots
+        if walking:
+            keys = map(bytes, bldgs[kept][:, next_to(unpack_int(used), open_slots)])
+        else:
+            keys = itertools.repeat(b'')
+        known = proven.setdefault((depth, used), {}) #other orders of the same sections reach the same state
+        alike = {}
+        for i, key in sorted(zip(kept.tolist(), keys), key = lambda item: lows[item[0]]):
+            if paid_so_far[i] + known.get(key, float('-inf')) >= threshold() or len(alike.get(key, [])) == k:
+                lows[i] = threshold() #as the k best with the same key complete the same ways, this cannot be among the k best
+            else:
+                alike.setdefault(key, []).append(i)
+        kept = sorted([(i, key) for key, same in alike.items() for i in same], key = lambda item: lows[item[0]])
+        if kept == []: return lows
+        if depth == n: #no timeslot is left open, so the bounds are the scores
+            for i, _ in kept:
+                push(float(lows[i]), itertools.islice(itertools.product(*picks[i]), k)) #the sections of a choice score the same
+            return lows
+
+        used_days = day_set(used)
+        fits = [option for option in choices[depth] if option[1] & used == 0]
+        fits.sort(key = lambda option: option[0] + weights['days'] * (option[2] & ~used_days).bit_count())
+        rows = [i for i, _ in kept]
+        lowest = np.full(len(rows), float('inf'))
+        children = []
+        for _, mask, _, (variant_costs, variant_rows, variant_bldgs) in fits:
+            child_rest = bound(depth + 1, used | mask)[0]
+            if child_rest is None: continue
+            cheapest = costs[rows] + variant_costs[0] + child_rest
+            if cheapest.min() >= threshold(): #even without the walks
+                lowest = np.minimum(lowest, cheapest)
+                continue
+            new_costs = (costs[rows][:, None] + variant_costs).ravel()
+            new_bldgs = np.maximum(bldgs[rows][:, None], variant_bldgs).reshape(len(new_costs), -1) if walking else None
+            new_paid = paid(depth + 1, used | mask, new_costs, new_bldgs)
+            children.append((float(new_paid.min()) + child_rest, mask, new_costs, variant_rows, new_bldgs, new_paid))
+        for _, mask, new_costs, variant_rows, new_bldgs, new_paid in sorted(children, key = lambda child: child[0]): #the most promising first
+            new_picks = [picks[i] + [choice] for i in rows for choice in variant_rows]
+            child_lows = search(depth + 1, used | mask, new_costs, new_picks, new_bldgs, new_paid)
+            lowest = np.minimum(lowest, child_lows.reshape(len(rows), -1).min(axis = 1))
+        lowest = np.minimum(lowest, threshold())
+        for (i, key), low in zip(kept, lowest.tolist()):
+            known[key] = max(known.get(key, float('-inf')), low - paid_so_far[i])
+        lows[rows] = lowest
+        return lows
+
+    used = mask_ints(fixed_mask)[0]
+    if bound(0, used)[0] is None: return []
+    fixed_bldgs = catalog.slot_bldgs[list(fixed_rows)].max(axis = 0, initial = NO_CLASS)[None] if walking else None
+    search(0, used, np.zeros(1), [[]], fixed_bldgs, paid(0, used, np.zeros(1), fixed_bldgs))
+    return [(-score, tuple(rows[i] for i in original_order)) for score, _, rows in sorted(best, reverse = True)]
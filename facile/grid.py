@@ -0,0 +1,28 @@
+''' Laying out sections as the weekly schedule tables shown in the Schedule, Prof Locator, and Classroom Checker tabs.'''
+
+import numpy as np
+import pandas as pd
+
+from facile.timeslots import NDAYS, NSLOTS, unpack
+
+day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+def timeslot_names():
+    ''' Returns the names of the timeslots of a day (0700-0730, 0730-0800, ...).'''
+
+    times = [f'{700 + slot // 2 * 100 + slot % 2 * 30:04}' for slot in range(NSLOTS + 1)]
+    return [start + '-' + end for start, end in zip(times[:-1], times[1:])]
+
+def schedule_grid(labels, masks, sep = ' / '):
+    ''' Returns the weekly table of timeslots (rows) by days (columns) with each label in the timeslots of its mask.
+    Labels that share a timeslot are joined with sep in that cell.'''
+
+    rows, slots = np.nonzero(unpack(masks).reshape(-1, NDAYS * NSLOTS))
+    labels = np.asarray(labels, dtype = object)[rows]
+    order = np.argsort(slots, kind = 'stable')
+    slots, starts = np.unique(slots[order], return_index = True)
+
+    cells = np.full(NDAYS * NSLOTS, '', dtype = object)
+    if len(slots): cells[slots] = [sep.join(dict.fromkeys(group)) for group in np.split(labels[order], starts[1:])]
+    grid = pd.DataFrame(cells.reshape(NDAYS, NSLOTS).T, index = timeslot_names(), columns = day_names)
+    return grid.iloc[:NSLOTS - 1] # nothing starts at 2130
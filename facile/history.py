@@ -0,0 +1,96 @@
+''' The Free Slots of every section across the dated schedules snapshots, to follow how sections fill up during enlistment.
+
+The history is stored append-only as one small Feather file per snapshot in HISTORY_DIR, so a new snapshot folder costs
+one ingest of that folder. Run
+
+    python -m facile.history
+
+to ingest the snapshot folders that are not in the history yet.'''
+
+import os
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from facile.catalog import load_complete_list
+from facile.diff import snapshot_folders
+
+HISTORY_DIR = 'history'
+
+folder_pattern = r'^schedules_(?P<term>.+)_(?P<date>\d{8})(?:_(?P<time>\d{4}))?$' #schedules_<term>_<yyyymmdd>[_<hhmm>]
+history_columns = ['Term', 'Timestamp', 'Department', 'Subject Code', 'Section', 'Max No', 'Free Slots']
+
+def snapshot_time(folder):
+    ''' Returns the term and the timestamp of a dated snapshot folder such as schedules_2024-1_20240630_2220,
+    or None for folders without a date.'''
+
+    match = re.match(folder_pattern, os.path.basename(os.path.normpath(folder)))
+    if match == None: return None
+    return match['term'], pd.Timestamp(match['date'] + 'T' + (match['time'] or '0000'))
+
+def history_path(folder, history_dir = HISTORY_DIR):
+    ''' Returns the path of the history file of a snapshot folder.'''
+
+    return os.path.join(history_dir, os.path.basename(os.path.normpath(folder)) + '.feather')
+
+def ingest_snapshot(folder, history_dir = HISTORY_DIR):
+    ''' Appends the Free Slots of the sections of a dated snapshot folder to the history. Returns the path of its file.'''
+
+    term, timestamp = snapshot_time(folder)
+    complete_list, _ = load_complete_list(folder)
+    entries = complete_list.drop_duplicates(['Subject Code', 'Section'], keep = 'last') #all_ies repeats sections
+    entries = entries.assign(Term = term, Timestamp = timestamp)[history_columns]
+    entries = entries.astype({'Term' : 'category', 'Department' : 'category', 'Max No' : 'int32', 'Free Slots' : 'int32'})
+
+    os.makedirs(history_dir, exist_ok = True)
+    path = history_path(folder, history_dir)
+    feather.write_feather(pa.Table.from_pandas(entries, preserve_index = False), path + '.tmp', compression = 'uncompressed')
+    os.replace(path + '.tmp', path)
+    return path
+
+def update_history(root = '.', history_dir = HISTORY_DIR):
+    ''' Ingests the dated snapshot folders in root that are not in the history yet. Returns the paths of the new files.'''
+
+    return [ingest_snapshot(os.path.join(root, folder), history_dir) for folder in snapshot_folders(root)
+            if snapshot_time(folder) != None and not os.path.exists(history_path(folder, history_dir))]
+
+def load_history(history_dir = HISTORY_DIR):
+    ''' Returns every entry of the history sorted by term, section and time, with the Fill Rate of each section
+    (enlisted over Max No; above 1 for sections that were overfilled).'''
+
+    names = sorted(name for name in os.listdir(history_dir) if name.endswith('.feather')) if os.path.isdir(history_dir) else []
+    tables = [feather.read_table(os.path.join(history_dir, name), memory_map = True) for name in names]
+    if tables == []:
+        return pd.DataFrame(columns = history_columns + ['Fill Rate'])
+    history = pa.concat_tables(tables).to_pandas()
+    history = history.sort_values(['Term', 'Subject Code', 'Section', 'Timestamp'], kind = 'stable', ignore_index = True)
+    history['Fill Rate'] = fill_rate(history['Max No'], history['Free Slots'])
+    return history
+
+def fill_rate(max_no, free_slots):
+    ''' Returns the share of the slots that are taken; sections without slots count as empty.'''
+
+    return ((max_no - free_slots) / max_no.where(max_no > 0)).fillna(0)
+
+def section_curve(history, subject_code, section, term = None):
+    ''' Returns the Max No, Free Slots and Fill Rate of a section at each snapshot (of one term, if given).'''
+
+    entries = history[(history['Subject Code'] == subject_code) & (history['Section'] == section)]
+    if term != None: entries = entries[entries['Term'] == term]
+    return entries[['Term', 'Timestamp', 'Max No', 'Free Slots', 'Fill Rate']].reset_index(drop = True)
+
+def department_curve(history, department, term = None):
+    ''' Returns the total Max No and Free Slots of the sections of a department at each snapshot (of one term, if given),
+    and their Fill Rate.'''
+
+    entries = history[history['Department'] == department]
+    if term != None: entries = entries[entries['Term'] == term]
+    totals = entries.groupby(['Term', 'Timestamp'], observed = True, sort = True)[['Max No', 'Free Slots']].sum().reset_index()
+    totals['Fill Rate'] = fill_rate(totals['Max No'], totals['Free Slots'])
+    return totals
+
+if __name__ == '__main__':
+    for path in update_history():
+        print(path)
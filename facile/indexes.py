@@ -0,0 +1,87 @@
+''' Lookup tables from professors, rooms and the department, subject and section selectors to the rows of the catalog,
+built once per snapshot.'''
+
+import re
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+name_suffixes = {'JR', 'JR.', 'SR', 'SR.', 'SJ', 'S.J.', 'II', 'III', 'IV'}
+TBA = 'TBA, -' # the Instructor entry of a section with no professor yet
+tba_entries = {'TO BE ARRANGED'} # other ways AISIS writes it
+
+def is_suffix(part):
+    ''' Returns whether a part of an Instructor entry starts with a suffix such as Jr. or SJ ("JR. L.", "S.J.").'''
+
+    words = part.split()
+    return words != [] and words[0].upper() in name_suffixes
+
+def split_instructors(instructor):
+    ''' Splits an Instructor entry such as "LAST, FIRST, LAST, JR., FIRST" into the names of each professor. Suffixes
+    such as Jr. and SJ stay with the name they are written after, whether after the last name as AISIS usually does
+    ("LAST, JR., FIRST") or after the first name ("LAST, FIRST, JR. M.", "LAST, FR. FIRST, S.J.", "LAST, FIRST JR., M.",
+    with the middle initial after it). TO BE ARRANGED is TBA.'''
+
+    if instructor.strip().upper() in tba_entries: return [TBA]
+    parts = [part.strip() for part in instructor.split(',')]
+    names = []
+    i = 0
+    while i < len(parts):
+        last = parts[i]
+        i += 1
+        while i < len(parts) and parts[i].upper() in name_suffixes:
+            last += ', ' + parts[i]
+            i += 1
+        if i < len(parts):
+            name = last + ', ' + parts[i]
+            i += 1
+            while i < len(parts) and (is_suffix(parts[i]) or is_suffix(name.split()[-1]) and re.fullmatch(r'[A-Z]{1,2}\.', parts[i])):
+                name += ', ' + parts[i]
+                i += 1
+            names.append(name)
+        else:
+            names.append(last)
+    return names
+
+def build_index(keys):
+    ''' Converts a Series of lists of keys (one list per row of the catalog) into a read-only mapping
+    from each key to the sorted array of the rows that have it.'''
+
+    exploded = keys.explode().dropna()
+    groups = pd.Series(exploded.index.to_numpy(), index = exploded.to_numpy()).groupby(level = 0)
+    index = {}
+    for key, rows in groups:
+        rows = np.unique(rows.to_numpy())
+        rows.flags.writeable = False
+        index[key] = rows
+    return MappingProxyType(index)
+
+def build_prof_index(complete_list):
+    ''' Returns the mapping from each professor's name to the rows of the classes they teach, including co-taught classes.'''
+
+    instructors = complete_list['Instructor'].astype(object).fillna('')
+    names = {instructor : split_instructors(instructor) for instructor in instructors.unique() if instructor != ''}
+    return build_index(instructors.reset_index(drop = True).map(lambda instructor: names.get(instructor, [])))
+
+def build_room_index(complete_list):
+    ''' Returns the mapping from each room to the rows of the classes held there, splitting rooms separated by semicolons.'''
+
+    rooms = complete_list['Room'].astype(object).fillna('').reset_index(drop = True).str.split(';')
+    return build_index(rooms.map(lambda parts: [part.strip() for part in parts if part.strip() != '']))
+
+def build_section_index(complete_list):
+    ''' Returns the read-only lookup tables of the department, subject and section selectors: department -> its subjects
+    (Subject Code and Name), (department, subject) -> its sections, and (department, subject, section) -> the first row
+    with them. Subjects and sections are in the order of complete_list, as AISIS lists them.'''
+
+    keys = complete_list[['Department', 'Subject Code and Name', 'Section']].drop_duplicates()
+    section_row = dict(zip(zip(keys['Department'], keys['Subject Code and Name'], keys['Section']), keys.index.tolist()))
+    subject_sections, dept_subjects = {}, {}
+    for dept, subj, sect in section_row:
+        subject_sections.setdefault((dept, subj), []).append(sect)
+    for dept, subj in subject_sections:
+        dept_subjects.setdefault(dept, []).append(subj)
+    return (MappingProxyType({dept : tuple(subjs) for dept, subjs in dept_subjects.items()}),
+            MappingProxyType({key : tuple(sects) for key, sects in subject_sections.items()}),
+            MappingProxyType(section_row))
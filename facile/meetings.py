@@ -0,0 +1,43 @@
+''' Splitting the sections that meet more than once into one row per meeting.'''
+
+import numpy as np
+
+from facile.timeslots import parse_masks
+
+def build_meetings(complete_list):
+    ''' Returns one row per meeting of each section of complete_list (Row is the section's row id) with the Time and
+    Room of that meeting, and the (n, 3) timeslot masks of the meetings. Times and rooms separated by semicolons are
+    split together; a section with one room for several times has that room for every meeting.'''
+
+    times = complete_list['Time'].str.split('(').str[0].str.split(';')
+    rooms = complete_list['Room'].str.split(';')
+    n_times = times.str.len().to_numpy()
+    n_rooms = rooms.str.len().to_numpy()
+
+    rows = np.repeat(np.arange(len(complete_list)), n_times)
+    position = np.arange(len(rows)) - np.repeat(np.cumsum(n_times) - n_times, n_times) #which meeting of the section
+    room_parts = rooms.explode().str.strip().to_numpy()
+    room_starts = np.cumsum(n_rooms) - n_rooms
+    paired = (n_rooms == n_times)[rows]
+    meeting_rooms = np.where(paired, room_parts[np.where(paired, room_starts[rows] + position, 0)],
+                             complete_list['Room'].str.strip().to_numpy()[rows])
+
+    meetings = complete_list[['Department', 'Subject Code and Name', 'Subject Code', 'Section', 'Instructor']].iloc[rows]
+    meetings = meetings.reset_index(drop = True)
+    meetings.insert(0, 'Row', rows)
+    meetings['Time'] = times.explode().str.strip().to_numpy()
+    meetings['Room'] = meeting_rooms
+    meetings['Display Schedule'] = meetings['Subject Code'] + ' ' + meetings['Section'] + ' (' + meetings['Room'] + ')'
+
+    masks = parse_masks(meetings['Time'])
+    masks.flags.writeable = False
+    return meetings, masks
+
+def meetings_of(catalog, rows):
+    ''' Returns the positions in catalog.meetings of the meetings of the given rows of complete_list, in the order of rows.'''
+
+    rows = np.asarray(rows, dtype = np.int64)
+    meeting_rows = catalog.meetings['Row'].to_numpy()
+    starts = np.searchsorted(meeting_rows, rows, 'left')
+    ends = np.searchsorted(meeting_rows, rows, 'right')
+    return np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)] + [np.zeros(0, dtype = np.int64)])
@@ -0,0 +1,56 @@
+''' When each room is in use: a rooms by timeslots table built once per snapshot, and the free rooms and free windows
+found from it.'''
+
+import numpy as np
+import pandas as pd
+
+from facile.timeslots import NDAYS, NSLOTS, NWORDS, slot_numbers, unpack
+
+def build_occupancy(meetings, meeting_masks, rooms):
+    ''' Returns the (len(rooms), 180) boolean array of whether a class is held in each room at each timeslot, from the
+    meetings of the catalog. A meeting in several rooms separated by semicolons takes all of them.'''
+
+    meeting_rooms = meetings['Room'].reset_index(drop = True).str.split(';').explode().str.strip()
+    positions = pd.Index(rooms).get_indexer(meeting_rooms.to_numpy())
+    held = positions >= 0 #TBA is not a room
+    room_masks = np.zeros((len(rooms), NWORDS), dtype = np.uint64)
+    np.bitwise_or.at(room_masks, positions[held], meeting_masks[meeting_rooms.index.to_numpy()[held]])
+    occupancy = unpack(room_masks)
+    occupancy.flags.writeable = False
+    return occupancy
+
+def window_slots(day, start, end):
+    ''' Returns the boolean array of the 180 timeslots from start to end (hhmm, e.g. 1300 to 1430) of a day (M = 0).
+    Times outside 0700 to 2200 are cut to the day, so that a window never runs into the next day.'''
+
+    first, stop = np.clip(slot_numbers(np.array([start, end])), 1, NSLOTS + 1)
+    slots = np.zeros(NDAYS * NSLOTS, dtype = bool)
+    slots[day * NSLOTS + first - 1 : day * NSLOTS + stop - 1] = True
+    return slots
+
+def free_rooms(catalog, slots, bldg = None):
+    ''' Returns the rooms (and their buildings) of complete_rooms, or of one building, with no class in any of the given
+    timeslots, a boolean array of 180 timeslots such as the one from window_slots.'''
+
+    free = ~(catalog.room_occupancy & slots).any(axis = 1)
+    if bldg != None: free &= (catalog.complete_rooms['Building'] == bldg).to_numpy()
+    return catalog.complete_rooms[free].reset_index(drop = True)
+
+def free_windows(catalog, day, start = 700, end = 2200, min_minutes = 30, bldg = None):
+    ''' Returns every stretch of at least min_minutes from start to end (hhmm) of a day (M = 0) in which a room, of
+    complete_rooms or of one building, has no class, with its Room, Building, From and To (hhmm) and Minutes.'''
+
+    window = window_slots(day, start, end)[day * NSLOTS : (day + 1) * NSLOTS]
+    free = ~catalog.room_occupancy[:, day * NSLOTS : (day + 1) * NSLOTS] & window
+    if bldg != None: free &= (catalog.complete_rooms['Building'] == bldg).to_numpy()[:, None]
+
+    edges = np.diff(np.pad(free, ((0, 0), (1, 1))).astype(np.int8), axis = 1) #+1 where a free stretch starts, -1 after it
+    rooms, starts = np.nonzero(edges == 1)
+    _, stops = np.nonzero(edges == -1) #in the same order: one stop per start in each row
+    long = (stops - starts) * 30 >= min_minutes
+    rooms, starts, stops = rooms[long], starts[long], stops[long]
+    return pd.DataFrame({'Room' : catalog.complete_rooms['Room'].to_numpy()[rooms],
+                         'Building' : catalog.complete_rooms['Building'].to_numpy()[rooms],
+                         'From' : [f'{700 + slot // 2 * 100 + slot % 2 * 30:04}' for slot in starts],
+                         'To' : [f'{700 + slot // 2 * 100 + slot % 2 * 30:04}' for slot in stops],
+                         'Minutes' : (stops - starts) * 30})
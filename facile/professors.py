@@ -0,0 +1,41 @@
+''' The subjects and departments taught by each professor, aggregated over the whole catalog at once.'''
+
+import numpy as np
+import pandas as pd
+
+from facile.indexes import split_instructors
+
+def build_teaching_load(complete_list, code_dict, dept_full_name_dict):
+    ''' Returns one row per professor teaching alone (one name in the Instructor entry) with their teaching load
+    (number of sections per subject), subjects, catalog codes, and departments taught, using code_dict to map catalog
+    codes to departments and dept_full_name_dict to map departments to their full names.'''
+
+    code_dict = {**code_dict, 'NSTP' : 'NSTP'}
+    dept_full_name_dict = {**dept_full_name_dict, 'NSTP' : 'National Service Training Program'}
+
+    # the professor of each section taught alone, None for co-taught sections
+    instructors = complete_list['Instructor'].astype(object).fillna('')
+    names = {instructor : split_instructors(instructor) for instructor in instructors.unique()}
+    professors = instructors.map(lambda instructor: names[instructor][0] if len(names[instructor]) == 1 and instructor != '' else None)
+
+    # one row per (professor, subject), in the order they first appear, with the catalog code
+    counts = complete_list.assign(Instructor = professors).groupby(['Instructor', 'Subject Code'], sort = False).size()
+    pairs = counts.index.to_frame(index = False)
+    pairs['Catalog Code'] = pairs['Subject Code'].str.split().str[0]
+
+    # the same rows grouped by professor, in sorted order; the departments follow from the catalog codes
+    taught = pairs.groupby('Instructor', sort = True)
+    codes = taught['Catalog Code'].agg(set).to_list()
+    depts = [{code_dict[code] for code in prof_codes if code in code_dict} for prof_codes in codes]
+    full_names = [{dept_full_name_dict[dept] for dept in prof_depts if dept in dept_full_name_dict} for prof_depts in depts]
+    subjects = taught['Subject Code'].agg(list).to_list()
+    loads = counts.sort_values(ascending = False, kind = 'stable')
+    loads = pd.Series(list(zip(loads.index.get_level_values(1), loads.tolist())), index = loads.index.get_level_values(0))
+
+    prof_unique = pd.DataFrame({'Professor' : taught.size().index.to_numpy(),
+                                'Teaching Load' : loads.groupby(level = 0, sort = True).agg(list).map(dict).to_list(),
+                                'Subjects Taught' : [np.array(subjs, dtype = object) for subjs in subjects],
+                                'Catalog Codes Taught' : codes,
+                                'Departments Taught' : depts,
+                                'Departments Taught, Full Name' : full_names})
+    return prof_unique
@@ -0,0 +1,72 @@
+''' Following the newest schedules snapshot while the app is running, instead of redeploying for every new folder.'''
+
+import logging
+import os
+import threading
+import time
+
+from facile.catalog import load_catalog, load_depts, snapshot_key
+from facile.diff import snapshot_folders
+from facile.history import snapshot_time
+
+logger = logging.getLogger(__name__)
+
+def is_complete(folder):
+    ''' Returns whether a snapshot folder has the CSV of every department, i.e. it is not still being copied.'''
+
+    _, dept_short_names, _ = load_depts()
+    return all(os.path.isfile(os.path.join(folder, name + '.csv')) for name in dept_short_names)
+
+def latest_snapshot(root = '.'):
+    ''' Returns the path of the complete dated snapshot folder in root with the latest timestamp, or None.'''
+
+    dated = [(snapshot_time(folder)[1], folder) for folder in snapshot_folders(root) if snapshot_time(folder) != None]
+    for _, folder in sorted(dated, reverse = True):
+        if is_complete(os.path.join(root, folder)):
+            return os.path.normpath(os.path.join(root, folder))
+    return None
+
+class SnapshotWatcher:
+    ''' Holds the catalog of the newest complete snapshot folder (or of a pinned folder) and swaps in a new catalog
+    when a newer folder appears or a CSV of the current folder changes.
+
+    The catalog is replaced with a single assignment once the new one is fully built, so a script run that read
+    watcher.catalog keeps a consistent view until its next rerun. Only one caller builds at a time; the others keep
+    the current catalog in the meantime, as does everyone if the new folder fails to load.'''
+
+    def __init__(self, root = '.', folder = None, interval = 30):
+        self.root = root
+        self.folder = folder # None follows the newest snapshot
+        self.interval = interval # seconds between checks of the folders
+        self.lock = threading.Lock()
+        self.checked = None
+        self.key = None
+        self.catalog = None
+        self.refresh()
+
+    def refresh(self):
+        ''' Checks the folders if the last check was more than interval seconds ago, reloads the catalog if they changed,
+        and returns the current catalog.'''
+
+        now = time.monotonic()
+        if self.checked is not None and now - self.checked < self.interval:
+            return self.catalog
+        if not self.lock.acquire(blocking = self.catalog is None):
+            return self.catalog
+        folder = self.folder
+        try:
+            self.checked = now
+            folder = self.folder or latest_snapshot(self.root)
+            if folder is None:
+                raise FileNotFoundError(f'No complete snapshot folder in {os.path.abspath(self.root)}')
+            key = (os.path.normpath(folder), snapshot_key(folder))
+            if key != self.key:
+                self.catalog = load_catalog(folder)
+                self.key = key
+        except Exception:
+            if self.catalog is None: raise
+            # Keep the current catalog and try again at the next check
+            logger.exception('Could not load the snapshot folder %s; keeping %s', folder, self.catalog.folder)
+        finally:
+            self.lock.release()
+        return self.catalog
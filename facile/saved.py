@@ -0,0 +1,74 @@
+''' Resolving and checking the schedules saved with the Copy Paste box ({'nsubjs', 'depts', 'subjs', 'sects'}).'''
+
+import numpy as np
+
+from facile.indexes import build_section_index
+
+saved_fields = ['nsubjs', 'depts', 'subjs', 'sects']
+
+def section_rows(complete_list):
+    ''' Returns the dictionary from (Department, Subject Code and Name, Section) to the first row of complete_list with them,
+    for checking many schedules against one snapshot.'''
+
+    return dict(build_section_index(complete_list)[2])
+
+def first_row(catalog, dept, subj = None, sect = None):
+    ''' Returns the first row of complete_list in a department, narrowed down to a subject (Subject Code and Name) and a
+    section when they are given, or None if there is none. Looked up in the section tables of the catalog.'''
+
+    if subj == None:
+        subjs = catalog.dept_subjects.get(dept, ())
+        if subjs == (): return None
+        subj = subjs[0]
+    if sect == None:
+        sects = catalog.subject_sections.get((dept, subj), ())
+        if sects == (): return None
+        sect = sects[0]
+    return catalog.section_row.get((dept, subj, sect))
+
+def read_saved(save_dict):
+    ''' Returns the departments, subjects and sections of a saved schedule, or raises ValueError if it is malformed.'''
+
+    if not isinstance(save_dict, dict) or any(field not in save_dict for field in saved_fields):
+        raise ValueError(f'A saved schedule needs the fields {", ".join(saved_fields)}')
+    nsubjs, depts, subjs, sects = [save_dict[field] for field in saved_fields]
+    if not isinstance(nsubjs, int) or any(not isinstance(values, list) or len(values) < nsubjs for values in [depts, subjs, sects]):
+        raise ValueError('nsubjs must be a number and depts, subjs and sects lists of at least nsubjs entries')
+    return depts[:nsubjs], subjs[:nsubjs], sects[:nsubjs]
+
+def check_saved(complete_list, masks, save_dict, rows_of = None):
+    ''' Checks a saved schedule against a snapshot: whether each of its sections still exists, which pairs of sections
+    overlap, and how many free slots each section has left. Entries with only a department or a subject are listed
+    but not checked. rows_of is the dictionary from section_rows, if already built. Returns a JSON-serializable report.'''
+
+    try:
+        depts, subjs, sects = read_saved(save_dict)
+    except ValueError as error:
+        return {'valid' : False, 'error' : str(error)}
+    if rows_of == None: rows_of = section_rows(complete_list)
+
+    entries, rows = [], []
+    for dept, subj, sect in zip(depts, subjs, sects):
+        entry = {'dept' : dept, 'subj' : subj, 'sect' : sect}
+        if dept == None or subj == None or sect == None:
+            entry['status'] = 'incomplete'
+        else:
+            row = rows_of.get((dept, subj, sect)) if all(isinstance(value, str) for value in [dept, subj, sect]) else None
+            entry['status'] = 'found' if row != None else 'missing'
+            if row != None:
+                rows.append((len(entries), row))
+                entry['time'] = complete_list.at[row, 'Time']
+                entry['free_slots'] = int(complete_list.at[row, 'Free Slots'])
+        entries.append(entry)
+
+    found = masks[np.array([row for _, row in rows], dtype = np.int64)]
+    shared = (found[:, None, :] & found[None, :, :]).any(axis = -1)
+    overlaps = [[rows[i][0], rows[j][0]] for i, j in zip(*np.nonzero(np.triu(shared, 1)))]
+
+    return {'valid' : True,
+            'sections' : entries,
+            'missing' : [i for i, entry in enumerate(entries) if entry['status'] == 'missing'],
+            'overlaps' : overlaps,
+            'full' : [i for i, entry in enumerate(entries) if entry.get('free_slots', 1) <= 0],
+            'ok' : all(entry['status'] != 'missing' for entry in entries) and overlaps == []
+                   and all(entry.get('free_slots', 1) > 0 for entry in entries)}
@@ -0,0 +1,95 @@
+''' Ingesting a schedules snapshot folder into one columnar file, so that the app does not parse the CSVs on every start.
+
+The CSVs remain the source of truth: the file records a digest of the CSVs it was built from (the folder's, depts.csv
+and prefixes.csv) and of FORMAT_VERSION, and it is ignored once any of them changes. The file is generated, not
+committed: the app writes it the first time it builds a folder from its CSVs, and
+
+    python -m facile.snapshot [folders]
+
+(re)builds it ahead of time for the given folders, or for every snapshot folder, e.g. when deploying.'''
+
+import argparse
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from facile.diff import snapshot_folders
+from facile.timeslots import NWORDS, slot_lists
+
+SNAPSHOT_FILE = 'catalog.feather'
+DIGEST_FIELD = b'facile.source_digest'
+FORMAT_VERSION = 3 # bump when parse_masks, add_columns, the department overrides or the columns of the file change
+
+categorical_columns = ['Department', 'Instructor', 'Room']
+mask_columns = [f'mask{word}' for word in range(NWORDS)]
+
+def snapshot_path(folder):
+    ''' Returns the path of the columnar file of a snapshot folder.'''
+
+    return os.path.join(folder, SNAPSHOT_FILE)
+
+def source_digest(folder):
+    ''' Returns a digest of FORMAT_VERSION and of the names and contents of the CSVs the complete list of a snapshot
+    folder is built from: the folder's own, depts.csv and prefixes.csv. Unlike snapshot_key, it survives copying or
+    checking out the folder.'''
+
+    from facile.catalog import DEPTS_CSV, PREFIXES_CSV #facile.catalog reads the file with read_snapshot
+
+    digest = hashlib.sha256(f'format {FORMAT_VERSION}\0'.encode())
+    paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder)) if name.endswith('.csv')]
+    for path in paths + [DEPTS_CSV, PREFIXES_CSV]:
+        with open(path, 'rb') as file:
+            digest.update(os.path.basename(path).encode() + b'\0' + file.read() + b'\0')
+    return digest.hexdigest().encode()
+
+def write_snapshot(folder, complete_list, masks, digest):
+    ''' Writes the complete list of a snapshot folder and its timeslot masks as an uncompressed Feather file in the
+    folder, with the timeslot masks as uint64 columns and the department, instructor and room as dictionary columns,
+    marked with the digest of the CSVs they were built from. Returns the path of the file.'''
+
+    complete_list = complete_list.drop(columns = ['Modified Schedule']) #rebuilt from the masks
+    for word, column in enumerate(mask_columns):
+        complete_list[column] = masks[:, word]
+
+    table = pa.Table.from_pandas(complete_list, preserve_index = False)
+    table = table.replace_schema_metadata({**table.schema.metadata, DIGEST_FIELD : digest})
+    path = snapshot_path(folder)
+    temp = f'{path}.{os.getpid()}-{threading.get_ident()}.tmp' #sessions may write the same file at once
+    feather.write_feather(table, temp, compression = 'uncompressed') #uncompressed, so that reading it is cheap
+    os.replace(temp, path)
+    return path
+
+def ingest(folder):
+    ''' Builds the catalog of a snapshot folder from its CSVs and writes its columnar file. Returns the path of the file.'''
+
+    from facile.catalog import build_complete_list #facile.catalog reads the file with read_snapshot
+
+    digest = source_digest(folder)
+    return write_snapshot(folder, *build_complete_list(folder), digest)
+
+def read_snapshot(folder):
+    ''' Reads the columnar file of a snapshot folder and returns the complete list and its timeslot masks like
+    build_complete_list does, or None if there is no file or it was built from different CSVs or by another
+    FORMAT_VERSION. The dictionary columns stay categoricals, so each of their values is decoded once.'''
+
+    path = snapshot_path(folder)
+    if not os.path.exists(path): return None
+    table = feather.read_table(path)
+    if (table.schema.metadata or {}).get(DIGEST_FIELD) != source_digest(folder): return None
+
+    masks = np.column_stack([table[column].to_numpy() for column in mask_columns]).astype(np.uint64)
+    complete_list = table.drop_columns(mask_columns).to_pandas()
+    complete_list.insert(complete_list.columns.get_loc('Department') + 1, 'Modified Schedule', slot_lists(masks))
+
+    masks.flags.writeable = False
+    return complete_list, masks
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Builds the columnar catalog file of schedules snapshot folders.')
+    parser.add_argument('folders', nargs = '*', help = 'snapshot folders such as schedules_2024-1_20240704_2024/ (default: all)')
+    for folder in parser.parse_args().folders or snapshot_folders():
+        print(ingest(folder))
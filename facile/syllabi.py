@@ -0,0 +1,103 @@
+''' Generating the AISIS syllabus links of the sections, for the whole catalog at once.
+
+A syllabus link looks like
+
+    aisis.ateneo.edu/syllabi/[a]/[b]/CS-[c]-[d]-[e]_[f]-[g]-[a]-[b].pdf
+
+where a and b are the school year and semester, c the department code for syllabi (from depts.csv and prefixes.csv),
+d the subject code without spaces, e_f the last names and first initials of the professors, and g the section.
+Run
+
+    python -m facile.syllabi <folder> [output.csv]
+
+to export the links of a snapshot folder.'''
+
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+suffixes = ['Jr.', 'JR.', 'Jr', 'JR', 'SJ', 'S.J.'] # written after the last name, as in "GO, SJ, JOHNNY C."
+special_dept_codes = {'NSTP 11(CWTS)' : 'NSTP (OSCI)', 'NSTP 12(CWTS)' : 'NSTP (OSCI)',
+                      'NSTP 11(ROTC)' : 'NSTP (ADAST)', 'NSTP 12(ROTC)' : 'NSTP (ADAST)'}
+term_pattern = r'^schedules_(?P<year>\d{4})-?(?P<semester>\d{1,2})(?:_|$)' #schedules_2024-1_..., schedules_202302_...
+link_columns = ['Department', 'Subject Code', 'Section', 'Instructor', 'Syllabus Link']
+
+def snapshot_term(folder):
+    ''' Returns the school year and semester (0 for intersession) of a snapshot folder such as schedules_2024-1_20240704
+    or schedules_202302_20240109 as strings, or None if the folder name has no term.'''
+
+    match = re.match(term_pattern, os.path.basename(os.path.normpath(folder)))
+    if match == None: return None
+    return match['year'], str(int(match['semester']))
+
+def dept_codes(subject_codes, dept_syl_link_names = None, code_dict = None):
+    ''' Returns the department code for syllabi of each subject code: the prefix of the code if it is one of the codes
+    in depts.csv, and the code in prefixes.csv for it otherwise (NaN if there is none).'''
+
+    from facile.catalog import load_depts, load_prefixes #facile.catalog builds the links with this module
+    if dept_syl_link_names is None: dept_syl_link_names = load_depts()[0]['syl_link_name'][1:]
+    if code_dict == None: code_dict = load_prefixes()
+    subject_codes = pd.Series(subject_codes, dtype = object)
+    prefixes = subject_codes.str.split().str[0]
+    codes = prefixes.where(prefixes.isin(set(dept_syl_link_names)), prefixes.map(code_dict))
+    return subject_codes.map(special_dept_codes).fillna(codes)
+
+def prof_names(instructors):
+    ''' Returns the professors of each Instructor entry as they are written in syllabus links, LAST_F for one professor
+    and LAST1_F1_LAST2_F2_... for more, or None when that cannot be told: no professor, a name without a first name,
+    or more than one professor and a suffix after a last name.'''
+
+    instructors = pd.Series(instructors, dtype = object).fillna('')
+    commas = instructors.str.count(',').to_numpy()
+    # A suffix after the only last name stays with it: "GO, SJ, JOHNNY C." is the professor "GO, SJ" with initial J
+    suffixed = ((commas == 2) & instructors.str.split(', ').str[1].isin(suffixes)).to_numpy()
+    parts = instructors.where(~suffixed, instructors.str.replace(', ', '\0', n = 1)).str.split(', ')
+    n_profs = np.select([(commas - suffixed) % 2 == 1, commas == 2], [(commas - suffixed) // 2 + 1, 1], 0)
+
+    lengths = parts.str.len().to_numpy()
+    flat = np.concatenate(parts.to_list() + [[]]).astype(object)
+    rows = np.repeat(np.arange(len(parts)), lengths)
+    position = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    kept = position < 2 * n_profs[rows]
+    lasts = pd.Series(flat[kept & (position % 2 == 0)]).str.replace('\0', ', ')
+    initials = pd.Series(flat[kept & (position % 2 == 1)]).str[0]
+    pair_rows = rows[kept & (position % 2 == 0)]
+
+    names = np.full(len(parts), None, dtype = object)
+    joined = (lasts + '_' + initials.fillna('')).groupby(pair_rows, sort = True).agg('_'.join)
+    names[joined.index] = joined.to_numpy()
+    names[pair_rows[initials.isna().to_numpy()]] = None #a professor without a first name
+    return pd.Series(names, index = instructors.index)
+
+def syllabus_links(complete_list, year, semester, dept_syl_link_names = None, code_dict = None):
+    ''' Returns the syllabus link of each row of complete_list for a school year and semester, or None for the rows whose
+    department code or professors cannot be told.'''
+
+    depts = dept_codes(complete_list['Subject Code'], dept_syl_link_names, code_dict)
+    course_codes = complete_list['Subject Code'].str.replace(r'\s+', '', regex = True)
+    profs = prof_names(complete_list['Instructor'])
+    links = ('aisis.ateneo.edu/syllabi/' + year + '/' + semester + '/CS-' + depts + '-' + course_codes + '-' + profs
+             + '-' + complete_list['Section'] + '-' + year + '-' + semester + '.pdf')
+    return links.where(depts.notna() & profs.notna(), None)
+
+def link_table(complete_list, links):
+    ''' Returns the sections of complete_list with their syllabus links, for exporting. Interdisciplinary electives are
+    listed both in all_ies and in their home department, so only the home department is kept.'''
+
+    table = complete_list.assign(**{'Syllabus Link' : links})[link_columns]
+    return table.drop_duplicates(['Subject Code', 'Section'], keep = 'last')
+
+if __name__ == '__main__':
+    from facile.catalog import load_complete_list
+    folder = sys.argv[1]
+    term = snapshot_term(folder)
+    if term == None:
+        sys.exit(f'The school year and semester of {folder} cannot be told from its name.')
+    complete_list, _ = load_complete_list(folder)
+    table = link_table(complete_list, syllabus_links(complete_list, *term))
+    output = sys.argv[2] if len(sys.argv) > 2 else os.path.basename(os.path.normpath(folder)) + '_syllabi.csv'
+    table.to_csv(output, index = False)
+    print(f'{table["Syllabus Link"].notna().sum()} of {len(table)} sections written to {output}')
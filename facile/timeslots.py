@@ -0,0 +1,133 @@
+''' Converting AISIS schedule strings into timeslot bitmasks.
+
+A week has 6 days of 30 half-hour slots starting at 0700, and timeslot day*30 + j is the jth slot of the day (M = 0).
+A schedule is stored as a 180-bit mask in 3 uint64 words, each word holding two days of 30 bits,
+so that checking for overlaps over the whole catalog is a bitwise AND.'''
+
+import numpy as np
+import pandas as pd
+
+NDAYS = 6
+NSLOTS = 30
+NWORDS = 3
+
+daydict = {'M':0, 'T':1, 'W':2, 'WED':2, 'TH':3, 'F':4, 'S':5, 'SAT':5} #map the day abbreviation to the number
+schedule_pattern = r'(?P<days>[A-Z]+(?:-[A-Z]+)*)\s+(?P<start>\d{4})-(?P<end>\d{4})'
+
+def day_mask(days):
+    ''' Converts days in the form Day1-Day2-...-DayN into a 6-bit mask of the days.'''
+
+    if days == 'D': days = 'M-T-W-TH-F' #intersession
+    try:
+        return sum(1 << day for day in set(daydict[day] for day in days.split('-')))
+    except KeyError:
+        raise ValueError(f'Unknown days in schedule: {days}')
+
+def slot_numbers(times):
+    ''' Converts an array of times in the form hhmm into the number of the slot starting at that time (0700 is 1).'''
+
+    return (times // 100 - 7) * 2 + 1 + (times % 100 != 0)
+
+def parse_masks(schedules):
+    ''' Converts a column of AISIS schedules (Day1-...-DayN Time1-Time2, separated by semicolons for classes with
+    multiple schedules) into an (n, 3) array of timeslot masks in one pass. TBA and tutorial classes have empty masks.'''
+
+    schedules = pd.Series(np.asarray(schedules, dtype = object)).astype(str).str.upper()
+    masks = np.zeros((len(schedules), NWORDS), dtype = np.uint64)
+
+    no_time = schedules.str.contains('TUTORIAL|TBA')
+    parts = schedules[~no_time].str.extractall(schedule_pattern)
+    if len(parts) == 0: return masks
+
+    rows = parts.index.get_level_values(0).to_numpy()
+    days = parts['days'].map({days : day_mask(days) for days in parts['days'].unique()}).to_numpy()
+    start = slot_numbers(parts['start'].astype(int).to_numpy())
+    end = slot_numbers(parts['end'].astype(int).to_numpy())
+    start = np.clip(start, 1, NSLOTS + 1)
+    end = np.clip(end, start, NSLOTS + 1)
+    runs = ((1 << (end - 1)) - (1 << (start - 1))).astype(np.uint64) #the slots from start to end within a day
+
+    for day in range(NDAYS):
+        on = (days >> day) & 1 == 1
+        np.bitwise_or.at(masks[:, day // 2], rows[on], runs[on] << np.uint64(day % 2 * NSLOTS))
+    return masks
+
+def unpack(masks):
+    ''' Converts masks of shape (..., 3) into boolean arrays of shape (..., 180), where index i is timeslot i+1.'''
+
+    masks = np.asarray(masks, dtype = np.uint64)
+    bits = (masks[..., None] >> np.arange(2 * NSLOTS, dtype = np.uint64)) & np.uint64(1)
+    return bits.reshape(masks.shape[:-1] + (NDAYS * NSLOTS,)).astype(bool)
+
+def pack(slot_array):
+    ''' Converts boolean arrays of shape (..., 180) back into masks of shape (..., 3).'''
+
+    slot_array = np.asarray(slot_array, dtype = np.uint64)
+    bits = slot_array.reshape(slot_array.shape[:-1] + (NWORDS, 2 * NSLOTS)) << np.arange(2 * NSLOTS, dtype = np.uint64)
+    return np.bitwise_or.reduce(bits, axis = -1)
+
+def mask_from_slots(slots):
+    ''' Converts a list of timeslot numbers into a mask.'''
+
+    slot_array = np.zeros(NDAYS * NSLOTS, dtype = bool)
+    slot_array[np.asarray(list(slots), dtype = int) - 1] = True
+    return pack(slot_array)
+
+def slot_lists(masks):
+    ''' Converts an (n, 3) array of masks into n lists of timeslot numbers.'''
+
+    slot_array = unpack(masks)
+    return [(np.flatnonzero(row) + 1).tolist() for row in slot_array]
+
+def combine(masks):
+    ''' Returns the union of an (n, 3) array of masks.'''
+
+    return np.bitwise_or.reduce(np.asarray(masks, dtype = np.uint64).reshape(-1, NWORDS), axis = 0)
+
+def overlaps(masks, mask):
+    ''' Returns whether each of the masks shares a timeslot with the given mask.'''
+
+    return (np.asarray(masks, dtype = np.uint64) & mask).any(axis = -1)
+
+def has_overlap(masks):
+    ''' Returns whether any two of the masks share a timeslot.'''
+
+    return bool((unpack(np.asarray(masks, dtype = np.uint64).reshape(-1, NWORDS)).sum(axis = 0) > 1).any())
+
+empty_mask = np.zeros(NWORDS, dtype = np.uint64)
+early_mask = mask_from_slots([i for j in range(5) for i in range(30*j + 1, 30*j + 4)]) #before 0830, M to F
+late_mask = mask_from_slots([i for j in range(5) for i in range(30*j + 21, 30*j + 30)]) #from 1700, M to F
+
+def mask_ints(masks):
+    ''' Converts an (n, 3) array of masks into n Python integers of 180 bits, which are faster to combine one at a time.'''
+
+    return [a | b << 64 | c << 128 for a, b, c in np.asarray(masks, dtype = np.uint64).reshape(-1, NWORDS).tolist()]
+
+def unpack_int(mask):
+    ''' Converts a mask integer of 180 bits into a boolean array of shape (180,), like unpack.'''
+
+    return unpack(np.array([mask & (1 << 64) - 1, mask >> 64 & (1 << 64) - 1, mask >> 128], dtype = np.uint64))
+
+day_offsets = [64 * (day // 2) + NSLOTS * (day % 2) for day in range(NDAYS)] #where each day starts in a mask integer
+day_bits = (1 << NSLOTS) - 1
+
+def day_set(mask):
+    ''' Returns the 6-bit mask of the days with classes in a mask integer.'''
+
+    return sum(1 << day for day, offset in enumerate(day_offsets) if mask >> offset & day_bits)
+
+def campus_days(mask):
+    ''' Returns the number of days with classes in a mask integer.'''
+
+    return day_set(mask).bit_count()
+
+def gap_slots(mask):
+    ''' Returns a mask integer of the free timeslots between the first and last classes of each day.'''
+
+    gaps = 0
+    for offset in day_offsets:
+        day = mask >> offset & day_bits
+        if day:
+            span = (1 << day.bit_length()) - (day & -day) #from the first to the last class
+            gaps |= (span & ~day) << offset
+    return gaps
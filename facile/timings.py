@@ -0,0 +1,155 @@
+''' Timing the named stages of each run of the app, for the debug panel and for a log of every run.
+
+The app starts a RunTimings at the top of each run, and the code wraps its stages in `with stage(name):`; stages
+outside a run (the command-line tools) are not timed. Memory allocated by each stage is recorded while tracemalloc is
+tracing, which the app turns on when TRACE_MEMORY_ENV is set, since tracing slows every session of the process. As
+tracemalloc counts the memory of the whole process, the memory of a stage is only recorded if no stage of another run
+was open at any time during it; the stages of runs that overlap only get their times.
+
+The timings of every run are logged as one JSON line to the facile.timings logger, which writes to the file named by
+LOG_ENV if it is set. Run
+
+    python -m facile.timings <log file>
+
+to get the percentiles of the time of each stage over the runs in a log.'''
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+DEBUG_ENV = 'FACILE_DEBUG' # shows the debug panel to every session
+DEBUG_PARAM = 'debug' # ?debug=1 shows the debug panel to one session
+TRACE_MEMORY_ENV = 'FACILE_TRACE_MEMORY'
+LOG_ENV = 'FACILE_TIMINGS_LOG'
+PERCENTILES = [0.5, 0.9, 0.99]
+
+logger = logging.getLogger('facile.timings')
+current = threading.local() # the RunTimings of the run in this thread; each session runs in its own thread
+open_runs = {} # RunTimings -> number of its stages being timed while tracing, in every thread
+open_lock = threading.Lock()
+
+class RunTimings:
+    ''' The wall time, and the memory allocated while tracemalloc is tracing, of each stage of one run. Nested stages
+    are named after the stages they are in (Map/base map).'''
+
+    def __init__(self):
+        self.stages = [] # in the order they started
+        self.open = [] # [record, start time, traced memory at the start, peak so far, overlapped] of the stages being timed
+        self.start = time.perf_counter()
+        self.seconds = None
+
+    def update_peaks(self):
+        ''' Raises the peaks of the open stages to the peak traced since the last update, and starts a new peak.'''
+
+        current_memory, peak = tracemalloc.get_traced_memory()
+        for timing in self.open:
+            timing[3] = max(timing[3], peak)
+        tracemalloc.reset_peak()
+        return current_memory
+
+    @contextmanager
+    def stage(self, name):
+        ''' Times the code run inside it as the stage name.'''
+
+        tracing = tracemalloc.is_tracing()
+        record = {'stage' : '/'.join([timing[0]['stage'] for timing in self.open[-1:]] + [name])}
+        self.stages.append(record)
+        memory = self.update_peaks() if tracing else None
+        self.open.append([record, time.perf_counter(), memory, memory, False])
+        if tracing:
+            with open_lock:
+                open_runs[self] = open_runs.get(self, 0) + 1
+                if len(open_runs) > 1: #the memory traced is no longer this run's alone
+                    for run in open_runs:
+                        for timing in run.open: timing[4] = True
+        try:
+            yield
+        finally:
+            end_memory = self.update_peaks() if tracing else None
+            _, start, memory, peak, overlapped = self.open.pop()
+            record['seconds'] = time.perf_counter() - start
+            if tracing:
+                with open_lock:
+                    open_runs[self] -= 1
+                    if open_runs[self] == 0: del open_runs[self]
+            if tracing and not overlapped:
+                record['allocated_mb'] = (end_memory - memory) / 2 ** 20
+                record['peak_mb'] = (peak - memory) / 2 ** 20
+
+    def finish(self, **fields):
+        ''' Ends the run and logs its timings with fields such as the session id. Returns the log record.'''
+
+        self.seconds = time.perf_counter() - self.start
+        record = {'time' : pd.Timestamp.now().isoformat(timespec = 'seconds'), **fields,
+                  'seconds' : self.seconds, 'stages' : self.stages}
+        logger.info(json.dumps(record))
+        return record
+
+    def table(self):
+        ''' Returns the stages as a table, in the order they started.'''
+
+        return pd.DataFrame(self.stages, columns = ['stage', 'seconds', 'allocated_mb', 'peak_mb']).dropna(axis = 1, how = 'all')
+
+def start_run():
+    ''' Starts timing a run of the app in this thread, and returns its RunTimings.'''
+
+    current.run = RunTimings()
+    return current.run
+
+@contextmanager
+def stage(name):
+    ''' Times the code run inside it as a stage of the current run, if there is one.'''
+
+    run = getattr(current, 'run', None)
+    if run == None:
+        yield
+    else:
+        with run.stage(name):
+            yield
+
+def setup():
+    ''' Writes the facile.timings log to the file named by LOG_ENV and starts tracing memory if TRACE_MEMORY_ENV is set,
+    once per process.'''
+
+    path = os.environ.get(LOG_ENV)
+    if path and not logger.handlers:
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    if os.environ.get(TRACE_MEMORY_ENV) and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def read_log(path):
+    ''' Returns one row per stage of each run in a log written by RunTimings.finish, with the fields of the run.'''
+
+    rows = []
+    with open(path) as file:
+        for line in file:
+            if line.strip() == '': continue
+            run = json.loads(line)
+            fields = {key : value for key, value in run.items() if key not in ('stages', 'seconds')}
+            rows.append({**fields, 'stage' : '(total)', 'seconds' : run['seconds']})
+            rows += [{**fields, **record} for record in run['stages']]
+    return pd.DataFrame(rows)
+
+def percentiles(stages, percentiles = PERCENTILES):
+    ''' Returns the number of runs and the percentiles of the time in milliseconds of each stage.'''
+
+    grouped = (stages['seconds'] * 1000).groupby(stages['stage'])
+    table = grouped.quantile(percentiles).unstack()
+    table.columns = [f'p{round(p * 100)} (ms)' for p in percentiles]
+    return pd.concat([grouped.size().rename('runs'), table.round(1)], axis = 1).sort_values(table.columns[-1], ascending = False)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit('Usage: python -m facile.timings <log file>')
+    print(percentiles(read_log(sys.argv[1])).to_string())
@@ -0,0 +1,172 @@
+''' Finding the syllabus link that loads for a section, by trying the variants of its link that the AIV tab's
+troubleshooting guide lists (the order of the professors, where a Jr./SJ goes, and a former TBA professor).
+
+The variants of many sections are probed at once with HEAD requests, at most MAX_CONCURRENT at a time, and the links
+that load are kept in CACHE_FILE so that they are not probed again. Run
+
+    python -m facile.verify <folder> [subject codes] [--base-url URL] [--concurrency N]
+
+to check the sections of a snapshot folder (all of them if no subject codes are given). base_url replaces
+https://aisis.ateneo.edu, e.g. to try the checker against a local server.'''
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from facile.indexes import is_suffix, split_instructors
+from facile.syllabi import dept_codes, snapshot_term
+
+BASE_URL = 'https://aisis.ateneo.edu'
+CACHE_FILE = 'syllabus_cache.json'
+MAX_CONCURRENT = 8
+MAX_VARIANTS = 120 # per section; the professors of sections with many of them are not reordered past this
+TIMEOUT = 10 # seconds per request
+
+def professors(instructor):
+    ''' Returns the (last name, first name, suffix) of each professor of an Instructor entry, as split by
+    split_instructors, where suffix is the Jr./SJ written after the last or the first name, if any. Names with no
+    first name are left out.'''
+
+    profs = []
+    for name in split_instructors(instructor):
+        last, *rest = name.split(', ')
+        suffix = next((part.split()[0] for part in rest if is_suffix(part)), None)
+        firsts = [part for part in rest if not is_suffix(part)]
+        if firsts == []: continue
+        first = firsts[0]
+        if suffix == None and len(first.split()) > 1 and is_suffix(first.split()[-1]): #"LAST, FIRST JR., M."
+            first, suffix = first.rsplit(' ', 1)
+        profs.append((last, first, suffix))
+    return profs
+
+def name_variants(last, first, suffix):
+    ''' Returns the ways a professor can be written in a link: LAST, SUFFIX_F, LAST SUFFIX_F and LAST_F for a professor
+    with a suffix, LAST_F otherwise.'''
+
+    initial = first[:1]
+    if suffix == None:
+        return [f'{last}_{initial}']
+    return [f'{last}, {suffix}_{initial}', f'{last} {suffix}_{initial}', f'{last}_{initial}']
+
+def link_variants(subject_code, section, instructor, year, semester, dept_code = None):
+    ''' Returns the candidate syllabus links of a section, most likely first: the professors as in AISIS, then in the
+    other orders, with each way of writing their suffixes, and then with a former TBA professor first.'''
+
+    if dept_code == None: dept_code = dept_codes([subject_code])[0]
+    profs = professors(instructor)
+    if not isinstance(dept_code, str) or profs == []: return []
+
+    start = f'aisis.ateneo.edu/syllabi/{year}/{semester}/CS-{dept_code}-{"".join(subject_code.split())}-'
+    end = f'-{section}-{year}-{semester}.pdf'
+    names = []
+    for order in itertools.permutations(profs):
+        for written in itertools.product(*[name_variants(*prof) for prof in order]):
+            names.append('_'.join(written))
+            if len(names) >= MAX_VARIANTS // 2: break
+        if len(names) >= MAX_VARIANTS // 2: break
+    if any(prof[:2] == ('TBA', '-') for prof in profs):
+        return [start + name + end for name in names]
+    return [start + name + end for name in names] + [start + 'TBA_-_' + name + end for name in names]
+
+def link_url(link, base_url = BASE_URL):
+    ''' Returns the URL of a link without its host (aisis.ateneo.edu/...) on base_url.'''
+
+    path = link.split('/', 1)[1]
+    return base_url.rstrip('/') + '/' + urllib.parse.quote(path, safe = "/,()'")
+
+def head(url, timeout = TIMEOUT):
+    ''' Returns True if url answers a HEAD request with a PDF, False if it does not, and None if it cannot be reached.'''
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, method = 'HEAD'), timeout = timeout) as response:
+            return response.status == 200 and 'pdf' in response.headers.get('Content-Type', '')
+    except urllib.error.HTTPError:
+        return False
+    except (urllib.error.URLError, OSError):
+        return None
+
+def load_cache(path = CACHE_FILE):
+    ''' Returns the links that were found to load, by the key of their section.'''
+
+    if not os.path.exists(path): return {}
+    with open(path) as file:
+        return json.load(file)
+
+def save_cache(cache, path = CACHE_FILE):
+    ''' Writes the links that were found to load.'''
+
+    with open(path + '.tmp', 'w') as file:
+        json.dump(cache, file, indent = 0, sort_keys = True)
+    os.replace(path + '.tmp', path)
+
+def section_key(subject_code, section, instructor, year, semester):
+    ''' Returns the key of a section in the cache.'''
+
+    return f'{year}-{semester} {subject_code} {section} {instructor}'
+
+async def find_links(sections, base_url = BASE_URL, concurrency = MAX_CONCURRENT, cache = None):
+    ''' Returns the link that loads for each section, a (subject code, section, instructor, year, semester) tuple, or
+    None if no variant does. The variants of all the sections are probed together, at most concurrency at a time, and
+    the first variant in link_variants order that loads is kept. Sections in cache are not probed, and the links found
+    are added to it.'''
+
+    if cache == None: cache = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        async def probe(link):
+            async with semaphore:
+                return await loop.run_in_executor(executor, head, link_url(link, base_url))
+
+        async def find(section, dept_code):
+            key = section_key(*section)
+            if key in cache: return cache[key]
+            variants = link_variants(*section, dept_code)
+            tasks = [asyncio.ensure_future(probe(link)) for link in variants]
+            try:
+                for link, task in zip(variants, tasks): #in order, so that the likeliest variant wins
+                    if await task:
+                        cache[key] = link
+                        return link
+            finally:
+                for task in tasks: task.cancel()
+            return None
+
+        sections = [tuple(section) for section in sections]
+        depts = dept_codes([section[0] for section in sections])
+        return await asyncio.gather(*[find(section, dept_code) for section, dept_code in zip(sections, depts)])
+
+def verify_links(sections, base_url = BASE_URL, concurrency = MAX_CONCURRENT, cache_file = CACHE_FILE):
+    ''' Runs find_links with the on-disk cache, and returns the links found.'''
+
+    cache = load_cache(cache_file) if cache_file != None else {}
+    links = asyncio.run(find_links(sections, base_url, concurrency, cache))
+    if cache_file != None: save_cache(cache, cache_file)
+    return links
+
+if __name__ == '__main__':
+    from facile.catalog import load_complete_list
+
+    parser = argparse.ArgumentParser(description = 'Find the syllabus links that load for the sections of a snapshot folder.')
+    parser.add_argument('folder')
+    parser.add_argument('subjects', nargs = '*', help = 'subject codes to check (default: all)')
+    parser.add_argument('--base-url', default = BASE_URL)
+    parser.add_argument('--concurrency', type = int, default = MAX_CONCURRENT)
+    parser.add_argument('--cache', default = CACHE_FILE)
+    args = parser.parse_args()
+
+    complete_list, _ = load_complete_list(args.folder)
+    entries = complete_list.drop_duplicates(['Subject Code', 'Section'], keep = 'last')
+    if args.subjects != []: entries = entries[entries['Subject Code'].isin(args.subjects)]
+    year, semester = snapshot_term(args.folder)
+    sections = [(code, section, instructor, year, semester)
+                for code, section, instructor in zip(entries['Subject Code'], entries['Section'], entries['Instructor'])]
+    for (code, section, _, _, _), link in zip(sections, verify_links(sections, args.base_url, args.concurrency, args.cache)):
+        print(f'{code} {section}\t{link if link != None else "not found"}')
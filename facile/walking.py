@@ -0,0 +1,88 @@
+''' The walks between classes: distances between the buildings of bldg_coords, the walks of one timetable, and the
+walking cost of many timetables at once for ranking them.
+
+The classes of a timetable are laid out as the building of each of its 180 timeslots (NO_CLASS when free,
+UNKNOWN_BLDG for rooms that are not on the map, such as TBA), so that the walks of thousands of timetables are a few
+array operations.'''
+
+import numpy as np
+import pandas as pd
+
+from facile.buildings import bldg_codes, bldg_coords
+from facile.timeslots import NDAYS, NSLOTS, unpack
+
+EARTH_RADIUS = 6371000 # in meters
+TIGHT_DISTANCE = 250 # in meters; walking further than this between back-to-back classes is a tight transfer
+
+NO_CLASS = -1
+UNKNOWN_BLDG = len(bldg_codes) # the walks from and to it count as 0 meters
+
+def build_distances():
+    ''' Returns the matrix of the straight-line distances in meters between the buildings of bldg_coords, with a row and
+    column of zeros for UNKNOWN_BLDG.'''
+
+    latitude, longitude = np.radians(np.array([row[2:] for row in bldg_coords])).T
+    a = (np.sin((latitude[:, None] - latitude[None, :]) / 2) ** 2
+         + np.cos(latitude[:, None]) * np.cos(latitude[None, :]) * np.sin((longitude[:, None] - longitude[None, :]) / 2) ** 2)
+    distances = np.zeros((len(bldg_codes) + 1, len(bldg_codes) + 1))
+    distances[:-1, :-1] = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+    return distances
+
+bldg_distances = build_distances()
+bldg_code_index = {bldg : i for i, bldg in enumerate(bldg_codes)}
+
+def build_slot_bldgs(meetings, meeting_masks, room_bldg, n_rows):
+    ''' Returns an (n_rows, 180) array of the building (its index in bldg_coords) of each timeslot of each row of
+    complete_list, from its meetings.'''
+
+    codes = np.array([bldg_code_index.get(room_bldg.get(room), UNKNOWN_BLDG) for room in meetings['Room']], dtype = np.int8)
+    slot_bldgs = np.full((n_rows, NDAYS * NSLOTS), NO_CLASS, dtype = np.int8)
+    meeting_index, slots = np.nonzero(unpack(meeting_masks))
+    slot_bldgs[meetings['Row'].to_numpy()[meeting_index], slots] = codes[meeting_index]
+    slot_bldgs.flags.writeable = False
+    return slot_bldgs
+
+def walking_costs(slot_bldgs, schedules, tight_distance = TIGHT_DISTANCE):
+    ''' Returns the total distance in meters walked between consecutive classes of the same day, and the number of tight
+    transfers (back-to-back classes more than tight_distance apart), of each schedule of a (k, s) array of row ids of
+    complete_list.'''
+
+    schedules = np.asarray(schedules, dtype = np.int64).reshape(len(schedules), -1)
+    return layout_walks(slot_bldgs[schedules].max(axis = 1), tight_distance = tight_distance) # at most one class per slot
+
+def layout_walks(bldgs, open_slots = None, tight_distance = TIGHT_DISTANCE):
+    ''' Returns the total distance and the number of tight transfers of each timetable of a (k, 180) array of the
+    buildings of its timeslots, as walking_costs. The walks over a slot of open_slots, a boolean array of shape (180,),
+    are left out.'''
+
+    bldgs = bldgs.reshape(-1, NDAYS, NSLOTS).astype(np.int16)
+    # The latest class so far each day as slot * 32 + building, so that one running maximum finds both
+    latest = np.maximum.accumulate(np.where(bldgs != NO_CLASS, np.arange(NSLOTS, dtype = np.int16) * 32 + bldgs, -1), axis = -1)
+    previous = np.concatenate([np.full(latest.shape[:-1] + (1,), -1, dtype = np.int16), latest[..., :-1]], axis = -1)
+
+    walks = (bldgs != NO_CLASS) & (previous >= 0)
+    if open_slots is not None:
+        latest_open = np.maximum.accumulate(np.where(open_slots.reshape(-1, NDAYS, NSLOTS), np.arange(NSLOTS), -1), axis = -1)
+        walks &= previous // 32 > latest_open
+    distances = np.where(walks, bldg_distances.ravel()[np.maximum(previous, 0) % 32 * len(bldg_distances) + np.maximum(bldgs, 0)], 0)
+    tight = walks & (previous // 32 == np.arange(NSLOTS) - 1) & (distances > tight_distance)
+    return distances.sum(axis = (1, 2)), tight.sum(axis = (1, 2))
+
+def schedule_transfers(order, tight_distance = TIGHT_DISTANCE):
+    ''' Returns the walks between the consecutive classes of each day of a walking order (see
+    facile.buildings.walking_order): the Day (M = 0), the classes and buildings walked From and To, the Distance (m),
+    the Free Time (min) between them, and whether it is Tight.'''
+
+    same_day = (order['Day'].to_numpy()[1:] == order['Day'].to_numpy()[:-1])
+    before, after = order.iloc[:-1][same_day], order.iloc[1:][same_day]
+    from_codes = [bldg_code_index.get(bldg, UNKNOWN_BLDG) for bldg in before['Building']]
+    to_codes = [bldg_code_index.get(bldg, UNKNOWN_BLDG) for bldg in after['Building']]
+    transfers = pd.DataFrame({'Day' : before['Day'].to_numpy(),
+                              'From' : before['Display Schedule'].to_numpy(),
+                              'To' : after['Display Schedule'].to_numpy(),
+                              'From Building' : before['Building'].to_numpy(),
+                              'To Building' : after['Building'].to_numpy(),
+                              'Distance (m)' : bldg_distances[from_codes, to_codes].round().astype(int),
+                              'Free Time (min)' : 30 * (after['Start'].to_numpy() - before['End'].to_numpy())})
+    transfers['Tight'] = (transfers['Free Time (min)'] <= 0) & (bldg_distances[from_codes, to_codes] > tight_distance)
+    return transfers
@@ -0,0 +1,2 @@
+''' The tabs of the app, one module per tab, each with a render(catalog) function that shows the tab.
+The modules are only imported when their tab is first opened.'''
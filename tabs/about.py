@@ -0,0 +1,27 @@
+''' The About / Contact tab.'''
+
+import streamlit as st
+
+def render(catalog):
+    ''' Shows the tab.'''
+
+    st.subheader('About Me and the Project')
+    st.write('''I am Sted Micah Cheng from 4 BS Applied Mathematics - Data Science.
+\nThe first major project in this website is FACILE (Free Assistance for Class Indices in the Luck-Based Enlistment).
+It started from a simple idea to avoid scrolling through lists of schedules, with only first and second year core elective subjects
+(NatSc, PHILO 11, FLC, and PE) where one had to manually input the schedule (e.g. M-TH 0800-0930) to the Python code
+that converts it to timeslot numbers (3 4 5 93 94 95).
+It used to be in a Google Sheets file with over 800 columns, making it quite clunky.
+\nThe other major project in this website is AIV (AISIS Information Viewer, formerly the Syllabus Viewer).
+It started when I noticed patterns about the syllabus links, and around this time I also realized that they can all be
+opened in incognito mode. The instructions are almost all copied and pasted from the Google Document where they all used to be.
+\nThankfully, I was able to discover this website and integrate both of these into one platform.
+Hopefully this gives you a more streamlined experience of using them, as well as the other side projects I have here.''')
+    st.subheader('Problems, Questions, Suggestions?')
+    fb = 'facebook.com/stedcheng'
+    st.write('''Feel free to contact me via email (sted.cheng@student.ateneo.edu) or Facebook Messenger ([Sted Cheng](%s)).
+             If your message is regarding a code error, please screenshot the error and inform me what you inputted in the website.''' % fb)
+       
+    #misc
+    # dept_filter = st.multiselect('Department', dept_full_names)
+    # st.dataframe(complete_list[complete_list['Department'].isin(dept_filter)])
@@ -0,0 +1,261 @@
+''' The AIV tab: generating syllabus links from AISIS rows, and the guides to AISIS.'''
+
+import os
+
+import pandas as pd
+import streamlit as st
+
+from facile.catalog import load_depts, load_prefixes
+from facile.syllabi import link_table, snapshot_term, syllabus_links
+from facile.verify import verify_links
+
+dept_csv, _, _ = load_depts()
+dept_syl_link_names = dept_csv['syl_link_name'][1:]
+code_dict = load_prefixes()
+
+def view_syllabus(n):
+    ''' Shows n rows of inputs for AISIS rows and returns their syllabus links.'''
+
+    with st.container():
+        col0, col1, col2, col3 = st.columns([0.05, 0.1, 0.1, 0.5])
+        with col0: st.write('No.')
+        with col1: st.markdown('Year', help = '''The school year when the class was conducted.
+Note that Intersession is part of the next school year. Type 2022 for June 2022-May 2023, 2023 for June 2023-May 2024, etc.
+Default value is the current school year 2023-2024, i.e., "2023".''')
+        with col2: st.markdown('Semester', help = '''The semester when the class was conducted.
+Type 0 for Intersession (June-July), 1 for First Semester (August-December), and 2 for Second Semester (January-May).
+Default value is the current semester, i.e., "2".''')
+        with col3: st.markdown('Whole Row in AISIS', help = '''The whole row, as displayed in AISIS, of the class whose syllabus
+you want to access.''')
+
+    links = []
+    for i in range(n):
+        with st.container():
+            col0, col1, col2, col3 = st.columns([0.05, 0.1, 0.1, 0.5])
+            with col0: st.write(i+1)
+            with col1:
+                year = st.number_input('Year', 2018, 2025, value = 2024, label_visibility = 'collapsed', key = i*3+1)
+                year = str(year)
+            with col2:
+                semester = st.number_input('Semester', 0, 2, value = 0, label_visibility = 'collapsed', key = i*3+2)
+                semester = str(semester)
+            with col3:
+                row = st.text_input('Row', label_visibility = 'collapsed', key = i*3+3)
+                row = row.split('\t')
+                try:
+                    entry = pd.DataFrame({'Subject Code' : [row[0]], 'Section' : [row[1]], 'Instructor' : [row[6]]})
+                    link = syllabus_links(entry, year, semester, dept_syl_link_names, code_dict)[0]
+                    comma_count = row[6].count(',')
+                    if comma_count == 0:
+                        link = 'The link cannot be generated because there seems to be no professors.'
+                    elif comma_count % 2 == 0 and comma_count > 2:
+                        link = 'This class likely has many professors, and at least one has Jr./SJ. Not supported as of now.'
+                    elif link == None:
+                        raise ValueError('Unknown department or professor')
+                    links.append(link)
+
+                except:
+                    st.write(f'Please input the whole row in AISIS for subject {i+1}')
+
+    st.write('You can copy the processed links from here:')            
+    return links
+
+def render(catalog, selection = None):
+    ''' Shows the tab, with the syllabus links of the selection returned by tabs.main.render.'''
+
+    st.header('I. Syllabus Viewer')
+    st.subheader('Your Schedule')
+    sched_rows = [row for row in selection['sched_rows'] if row != None] if selection != None else []
+    if catalog.syllabus_links is None:
+        st.write('The school year and semester of these schedules are unknown, so their links cannot be generated.')
+    else:
+        if sched_rows == []:
+            st.write('Input your sections in the Main tab to get their syllabus links here.')
+        else:
+            sched_links = link_table(catalog.complete_list.iloc[sched_rows], catalog.syllabus_links.iloc[sched_rows])
+            if st.button('Find the links that load', help = '''FACILE will try the other ways of writing each link
+(see B. Troubleshooting) and keep the first one that loads. This may take a while.'''):
+                year, semester = snapshot_term(catalog.folder)
+                sched_links['Link That Loads'] = verify_links([(code, section, instructor, year, semester) for code, section, instructor
+                                                               in zip(sched_links['Subject Code'], sched_links['Section'], sched_links['Instructor'])])
+            st.dataframe(sched_links, hide_index = True, use_container_width = True)
+        st.download_button('Download the syllabus links of every section (CSV)',
+                           lambda: link_table(catalog.complete_list, catalog.syllabus_links).to_csv(index = False),
+                           file_name = os.path.basename(os.path.normpath(catalog.folder)) + '_syllabi.csv', mime = 'text/csv')
+
+    st.subheader('Other Classes')
+    # st.write(code_dict)
+
+    nsubjs_syl = st.number_input('Number of Subjects', 1, 10,
+                                 help = 'Input the number of subjects whose syllabus you want to check, from 1 to 10.')
+    st.write(view_syllabus(nsubjs_syl))
+
+    st.subheader('A. Steps for Automatic')
+    url = 'https://chrome.google.com/webstore/detail/open-multiple-urls/oifijhaokejakekmnjmphonojcfkpbbh/related?hl=en'
+    st.write('''1. Under "Number of Subjects", input the number of classes whose syllabi you want to check.
+\n2. Go to aisis.ateneo.edu (the usual AISIS where we do our enlistment), log in, and click "Class Schedules".
+\nIf the class whose syllabus you want to check was offered in a semester which is part of the options in the dropdown menu,
+select the year/semester and department under which your desired class is, and scroll to the class. 
+\nIf the class whose syllabus you want to check was offered in a semester which is not part of the options in the dropdown menu (i.e. too old),
+scroll down to the second hack. Follow the instructions to be able to access the schedules.
+\n3. After the links are outputted, you can copy and paste the links outputted by this syllabus viewer. 
+\n(Optional: If you are checking for many classes, I recommend using an extension to open multiple links at once,
+such as [this one](%s)).
+\n4. If the syllabus loads, then it is likely the correct one.''' % url)
+
+    st.subheader('B. Troubleshooting')
+    st.write('''Troubleshooting: Despite my best efforts, it may be possible that the syllabus does not load correctly.
+This may be due to a few reasons:
+\n1. There are Jr.s or SJs in the name(s) of the professor(s), which may be misinterpreted as the last name.
+Refer to Part E3 to resolve.
+\n2. The number of professors is more than one and the order of their names in the output is incorrect.
+Refer to Part E4 to resolve.
+\n3. The professor / One of the professors used to be a TBA professor. Refer to Part E5 to resolve.
+\nIf you try those methods and it still doesn't work, I don't have a solution as of the moment.
+Please let me know about your situation.''')
+
+    st.subheader('C. Steps for Manual')
+    st.write('The link to the syllabus looks like this:')
+    st.code('https://aisis.ateneo.edu/syllabi/[a]/[b]/CS-[c]-[d]-[e]_[f]-[g]-[a]-[b].pdf')
+    st.write('''where
+- a is the starting year of the school year (for the school year June 2021–May 2022, a = 2021)
+- b is the semester number (1 or 2, intersession is 0)
+- c is the old code of the department that offers the subject (refer to Part D)
+- d is the subject code, without spaces
+- e is the professor’s last name (refer to Part E)
+- f is the professor’s first name’s initial (refer to Part E)
+- g is the section (refer to Part F)
+\nNote that everything from c to g should be in all capitals, and that CS most likely means “Course/Class Syllabus”.
+Also, these links can all be opened in incognito.
+''')
+
+    st.subheader('D. On Departments and Corresponding Codes')
+    st.write(dept_csv[['syl_link_name', 'full_name']][1:])
+
+    st.subheader("E. On Professors' Names")
+    st.write('''
+1. If there is a space in the last name, use “%20” to substitute. Alternatively, you can also type the space as is in between the names, and when you hit enter, the “%20” will automatically appear.
+\nExample: The link to the syllabus for INTACT 11, section S2 is''')
+    st.code('https://aisis.ateneo.edu/syllabi/2021/1/CS-INTAC-INTACT11-CHAN%20SHIO_C-S2-2021-1.pdf')
+    st.write('which is equivalent to')
+    st.code('https://aisis.ateneo.edu/syllabi/2021/1/CS-INTAC-INTACT11-CHAN SHIO_C-S2-2021-1.pdf')
+    st.write('''2. If there is a dash in the professor’s last name, type as is.
+\nExample:''')
+    st.code('https://aisis.ateneo.edu/syllabi/2021/1/CS-MA-MATH10-LEE-CHUA_Q-MM-2021-1.pdf')
+    st.write('''3. If the professor has suffixes (Jr., II, III, SJ, etc.) in their name, they may use it in their first name or last name. Check the AISIS page for that. The note about the spacing also applies.
+\nExamples:''')
+    st.code('''https://aisis.ateneo.edu/syllabi/2022/1/CS-PS-PHYS23.01-SUGON,%20JR._Q-C-2022-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-SOCSCI-SocSc12-TANGARA_A-F1-2022-1.pdf
+https://aisis.ateneo.edu/syllabi/2021/1/CS-MA-MATH71.1-MUGA%20II_F-A-2021-1.pdf 
+https://aisis.ateneo.edu/syllabi/2022/1/CS-EU-EURO21-ENVERGA%20III_M-C-2022-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-CEPP-EDUC201-ALVAREZ,%20SJ_F-PQ-2022-1.pdf''')
+    st.write('''Note that the professor in the second example also has a Jr. in his name, but it is written under his first name,
+so it is not seen in the syllabus link.
+4. If there are n professors, replace [e]\_[f] with [$e_1$]\_[$f_1$]\_…\_[$e_n$]\_[$f_n$]
+\nwhere
+$e_i =$ Last Name of Professor $i$, $f_i =$ Initial of First Name of Professor $i$, for $i = 1, 2, \ldots, n$
+\nor in English,
+- $e_1$ is the first professor’s last name
+- $f_1$ is the first professor’s first name’s initial
+- … (and so on)
+- $e_n$ is the nth professor’s last name
+- $f_n$ is the nth professor’s first name’s initial
+\nExamples:''')
+    st.code('''https://aisis.ateneo.edu/syllabi/2021/1/CS-SOCSCI-SocSc11-ACOSTA_I_REYES_J-PSY-E-2021-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-MA-MATH199.11-TOLENTINO_M_DAVID_R_BENITO_D-T1-2022-1.pdf''')
+    st.write('''Note that the order of professors is alphabetical in the first example, but not in the second.
+Take note that AISIS arranges the professors alphabetically in the "Instructors" column.
+However, this is not always how the names are arranged in the link.
+You can try switching around the order of the names and checking if the syllabus loads.
+5. If the professor is, or used to be, marked as TBA, their last name is "TBA" and their first name is "-".
+(This corresponds to the professor’s name on AISIS, which is "TBA, -".)
+\nExamples:''')
+    st.code('''https://aisis.ateneo.edu/syllabi/2021/1/CS-MA-MATH71.1-TBA_-_TABARES_W-B-2021-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-CH-CHEM171.42-TBA_-_ENRIQUEZ_E-LAB2-DEF1-2022-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-CH-CHEM10.01-TBA_--CA-C-2022-1.pdf''')
+    st.write('It may look weird that there are two dashes, but that is how it is.')
+
+    st.subheader('F. On Sections')
+    st.write('''On sections: The section should be exactly the same from AISIS. Take note of the following:
+- "(MEN)" / "(WOMEN)" for PHYED courses
+- "-Q1" etc. for AY 2020–2021 subjects (due to the quarterly system)
+- dashes in NatSc, INTACT, and DLQ classes, among others
+\nExamples:''')
+    st.code('''https://aisis.ateneo.edu/syllabi/2021/1/CS-PE-PHYED114-MENDOZA_M-A(MEN)-2021-1.pdf 
+https://aisis.ateneo.edu/syllabi/2021/1/CS-PE-PHYED122-ASAJAR_A-G(WOMEN)-2021-1.pdf
+https://aisis.ateneo.edu/syllabi/2020/2/CS-PE-PHYED111-PUEN_D-N-Q4-2020-2.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-ES-ENVI10.01-CABALLES_D-CA-C-2022-1.pdf
+https://aisis.ateneo.edu/syllabi/2022/1/CS-SOHUM-DLQ10-SUAREZ_V-PH-A-2022-1.pdf''')
+    st.write('''The syllabi from the school year 2020–2021 and earlier seemed to work before, but not as of 24 January 2024''')
+
+    st.header('II. Old Schedule Viewer')
+    st.write('''This is for classes not under the Dropdown menu of “School Year and Term”.
+Credits to an anonymous faculty member.
+1. Login to AISIS, click on Class Schedule, and pick the Department.
+\n2. Right click on the dropdown menu for "School Year and Term", and click "Inspect".''')
+    st.image('images/osv1.png')
+    st.write('3. Click the black shaded triangle in the blue highlighted area.')
+    st.image('images/osv2.png')
+    st.write('''4. After the first <option> (which should be the most recent term), double click the value so that you can edit it.
+Change it in the format yyyy-s, where yyyy is the year when the school year started,
+and s is the semester number (0 for intersession, 1 for 1st semester, and 2 for 2nd semester). \nExamples:\n
+- January–May 2021: 2020-2
+- August–December 2019: 2019-1
+- June–July 2017: 2017-0''')
+    st.write('Before:')
+    st.image('images/osv3.png')
+    st.write('After I changed it to 2015-2, i.e. January–May 2016:')
+    st.image('images/osv4.png')
+    st.write('5. Click "Display Class Schedule"')
+    st.image('images/osv5.png')
+
+    st.header('III. Delisting from or Transferring Sections in a Preenlisted Class')
+    st.write('''If there’s one thing good from the early enlistment, it gave me time to explore the "Enlist in Class" option of AISIS.
+\n1. Login to AISIS and click "Enlist in Class".
+\n2. Click the checkbox at the end and then click "Proceed".
+\n3. Normally, if a course is preenlisted, the "Enlist/Delist" button will look different.
+Take note of the ordinal position (in Filipino: pang-ilan) of the course from which you want to delist,
+or the course where you want to change sections.
+\n4. Click the "Enlist/Delist" class for any of your classes where you can enlist (e.g. PE, FLC, NatSc). The link should look like this:''')
+    st.code('https://aisis.ateneo.edu/j_aisis/displayClasses.do?index=n')
+    st.write('''where $n \in \mathbb{N} \cup \{0\}$, or in English, $n$ is 0, 1, 2, etc.
+\n5. Change the n into the ordinal position of the course from which you want to delist,
+or the course where you want to change sections, minus 1. (This is since the computer starts counting at 0, as you might know.)
+The enlistment page for the desired course should be seen.
+\n6. If you want to delist, click "Remove Me From This Class".
+If you want to change sections, also click "Remove Me From This Class" and this should allow you to enlist in another section.
+\n7. Disclaimer: If the section to which you want to move is restricted or has zero or negative slots,
+you cannot enlist there. The trick only works if the new section has slots and is not restricted.''')
+
+    st.header('IV. Appendix')
+
+    st.subheader('A. Version with Login vs without Login')
+    aisis_updates = pd.DataFrame({'Version with Login' : ['https://aisis.ateneo.edu/j_aisis/J_VCSC.do',
+                                                          'Subject Code, Section, Course Title, Units, Time, Room, Instructor, Max No, Lang, Level, Free Slots, Remarks, S, P',
+                                                          'No', 'No', 'No', 'Yes', 'Yes'],
+                                  'Version without Login' : ['https://aisis.ateneo.edu/j_aisis/classSkeds.do',
+                                                             'Subject Code, Section, Course Title, Units, Time, Room, Instructor, Lang, Level, Remarks',
+                                                             'Yes', '10, 25, 50, or 100 entries at a time', 'Yes', 'No', 'No']},
+                                 index = ['Link', 'Columns', 'Sortable Columns', 'Show Limited Entries', 'Searchable', 'Filter by Course', 'All IEs Department'])
+    st.table(aisis_updates)
+
+    st.subheader('B. Links for each part of the page')
+    links_all = [['Landing Page', 'https://aisis.ateneo.edu/j_aisis/welcome.do'],
+                 ['View Advisory Grades', 'https://aisis.ateneo.edu/j_aisis/J_VADGR.do'],
+                 ['Online Tuition Payment', 'https://aisis.ateneo.edu/j_aisis/J_REASST.do'],
+                 ['Google Account', 'https://aisis.ateneo.edu/j_aisis/J_GOOGLE.do'],
+                 ['Enlist in Class', 'https://aisis.ateneo.edu/j_aisis/J_ENLC.do'],
+                 ['My Individual Program of Study', 'https://aisis.ateneo.edu/j_aisis/J_VIPS.do'],
+                 ['Print Tuition Receipt', 'https://aisis.ateneo.edu/j_aisis/J_PTR.do'],
+                 ['Official Curriculum', 'https://aisis.ateneo.edu/j_aisis/J_VOFC.do'],
+                 ['My Currently Enrolled Classes', 'https://aisis.ateneo.edu/j_aisis/J_VCEC.do'],
+                 ['My Grades', 'https://aisis.ateneo.edu/j_aisis/J_VG.do'],
+                 ['My Hold Orders', 'https://aisis.ateneo.edu/j_aisis/J_VHOR.do'],
+                 ['Print Tuition Assessment', 'https://aisis.ateneo.edu/j_aisis/J_PASS.do'],
+                 ['Update Student Information', 'https://aisis.ateneo.edu/j_aisis/J_STUD_INFO.do'],
+                 ['My Class Schedule', 'https://aisis.ateneo.edu/j_aisis/J_VMCS.do'],
+                 ['Change Password', 'https://aisis.ateneo.edu/j_aisis/J_CHPA.do'],
+                 ['View Enlistment Summary', 'https://aisis.ateneo.edu/j_aisis/J_VENS.do'],
+                 ['Class Schedule', 'https://aisis.ateneo.edu/j_aisis/J_VCSC.do']]
+    links_df = pd.DataFrame(links_all, columns = ['Title', 'Link'])
+    st.table(links_df)
@@ -0,0 +1,66 @@
+''' The Snapshot Changes tab: what changed between two snapshots, and how sections filled up across snapshots.'''
+
+import os
+
+import streamlit as st
+
+from facile.catalog import load_complete_list, snapshot_key
+from facile.diff import compared_columns, diff_snapshots, snapshot_folders
+from facile.history import department_curve, load_history, update_history
+
+@st.cache_data(show_spinner = 'Comparing the snapshots...', max_entries = 8)
+def get_snapshot_diff(old_folder, new_folder, old_key, new_key):
+    ''' Compares two snapshot folders; the keys are only used by the cache.'''
+    return diff_snapshots(load_complete_list(old_folder)[0], load_complete_list(new_folder)[0])
+
+@st.cache_data(show_spinner = 'Loading the Free Slots history...', max_entries = 1)
+def get_history(snapshots):
+    ''' Ingests the snapshot folders that are new since the last run and loads the history; snapshots is only used
+    by the cache.'''
+    update_history()
+    return load_history()
+
+def render(catalog):
+    ''' Shows the tab.'''
+
+    snapshots = snapshot_folders()
+    folder = os.path.basename(os.path.normpath(catalog.folder))
+    current = snapshots.index(folder) if folder in snapshots else None
+    old_folder = st.selectbox('Older snapshot', snapshots, index = max(current - 1, 0) if current != None else None)
+    new_folder = st.selectbox('Newer snapshot', snapshots, index = current)
+
+    st.subheader('Section Changes')
+    if old_folder == None or new_folder == None:
+        st.write('Please choose two snapshots.')
+    else:
+        snapshot_diff = get_snapshot_diff(old_folder, new_folder, snapshot_key(old_folder), snapshot_key(new_folder))
+        st.write(snapshot_diff['Status'].value_counts().reindex(['Added', 'Removed', 'Changed'], fill_value = 0))
+        status_filter = st.multiselect('Status', ['Added', 'Removed', 'Changed'], ['Added', 'Removed', 'Changed'])
+        change_filter = st.multiselect('Changes in', compared_columns, compared_columns,
+                                       help = 'Only applies to changed sections.')
+        shown = snapshot_diff['Status'].isin(status_filter) & ((snapshot_diff['Status'] != 'Changed') |
+                                                               snapshot_diff['Changes'].str.contains('|'.join(change_filter or ['^$'])))
+        st.dataframe(snapshot_diff[shown], use_container_width = True, hide_index = True)
+
+    st.subheader('Fill Rates')
+    history = get_history(tuple(snapshots))
+    term_input = st.selectbox('Term', sorted(history['Term'].unique()), index = None,
+                              help = 'The terms with at least one dated snapshot folder (schedules_<term>_<date>).')
+    if term_input == None:
+        st.write('Please choose a term.')
+    else:
+        term_history = history[history['Term'] == term_input]
+        fill_dept = st.selectbox('Department', sorted(term_history['Department'].unique()), index = None, key = 'fill_dept')
+        if fill_dept == None:
+            st.write('Please choose a department.')
+        else:
+            fill_curve = department_curve(term_history, fill_dept)
+            dept_history = term_history[term_history['Department'] == fill_dept]
+            fill_sections = st.multiselect('Sections', (dept_history['Subject Code'] + ' ' + dept_history['Section']).unique(),
+                                           help = 'Compare the fill rates of sections with the whole department.')
+            for fill_section in fill_sections:
+                curve = dept_history[dept_history['Subject Code'] + ' ' + dept_history['Section'] == fill_section]
+                fill_curve[fill_section] = fill_curve['Timestamp'].map(curve.set_index('Timestamp')['Fill Rate'])
+            st.line_chart(fill_curve.drop(columns = ['Term', 'Max No', 'Free Slots']).rename(columns = {'Fill Rate' : fill_dept})
+                          .set_index('Timestamp'))
+            st.dataframe(fill_curve, use_container_width = True, hide_index = True)
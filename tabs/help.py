@@ -0,0 +1,86 @@
+''' The Help and Samples tab.'''
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+def render(catalog):
+    ''' Shows the tab.'''
+
+    st.subheader('Input')
+    st.write('''1. Refer to your IPS to input the departments and subjects.
+2. Input the departments, subjects, and sections by the dropdown menus from left to right.
+3. If you already have a section for one or more classes, input the section first
+before checking the available schedules of other subjects.
+4. It may be advisable to start with your major subjects, because these
+have more limited schedules.''')
+
+    st.subheader('Department')
+    st.write('''1. Here are the departments that offer the core subjects:''')
+    subjects_regular_depts = ['ENGL 11, ENLIT 12', 'FILI 11, FILI 12', 'HISTO 11, HISTO 12', 'ArtAp 10, DLQ 10',
+                              'MATH 10', 'NSTP 11, NSTP 12 (ROTC - for those who signed up for it)',
+                              'NSTP 11, NSTP 12 (CWTS - default program)', 'PHILO 12, PHILO 13', 'PHYED 1xx', 'STS 10',
+                              'SocSc 11, SocSc 12, SocSc 13, SocSc 14',
+                              'THEO 11, THEO 12, THEO 13']
+    regular_depts_df = pd.DataFrame({'Department' : ['English', 'Filipino', 'History', 'Humanities', 'Mathematics',
+                                                     'National Service Training Program (ADAST)',
+                                                     'National Service Training Program (OSCI)',
+                                                     'Philosophy', 'Physical Education',
+                                                     'Science Block', 'Social Sciences', 'Theology'],
+                                     'Subjects Offered' : subjects_regular_depts},
+                                    index = np.arange(1,13))
+    st.table(regular_depts_df)
+    
+    st.write('''2. The majority of the departments in the dropdown menu correspond to the
+departments in AISIS, except for the elective core subjects shown below.
+These subjects will not appear under the original departments anymore''')
+    subjects_irregular_depts = ['ENE 13.03, 13.04, 13.05, 13.06',
+                                'CSP 11, FRE 11, GER 11, ITA 11, JPN 11, KRN 11, RUSS 11, SPA 11',
+                                '''BIO 10.01, BIO 11.01, BIO 12.01, CHEM 10.01, ENVI 10.01, PHYS 10.01
+and the corresponding lab classes''',
+                                'PHILO 11.03, 11.04, 11.05, 11.06']
+    irregular_depts_df = pd.DataFrame({'Department' : ['IE 1', 'FLC', 'NatSc', 'PHILO 11'],
+                                       'Subjects Offered' : subjects_irregular_depts},
+                                      index = np.arange(1,5))
+    st.table(irregular_depts_df)
+
+    st.subheader('Sample Data')
+    st.write('Here are some sample data you can use for testing FACILE and AIV (Syllabus Viewer). The copy button is at the right of the text to be copied.')
+    st.write('For AIV (Syllabus Viewer) (Note that this class was/is offered in Year 2023, Semester 2:')
+    st.code('''MATH 62.2	F	TIME SERIES AND FORECASTING	3	M-TH 1530-1700
+(FULLY ONSITE)	SEC-A302A	BRIONES, JERIC C.	30	ENG	U	1	-	N	N''')
+    st.write('For FACILE:')
+    st.code('''{
+  "nsubjs": 8,
+  "depts": [
+    "Economics",
+    "Mathematics",
+    "Mathematics",
+    "Mathematics",
+    "Mathematics",
+    "Information Systems and Computer Science",
+    "Philosophy",
+    "Theology"
+  ],
+  "subjs": [
+    "ECON 112: INTERMEDIATE MACROECONOMIC THEORY",
+    "MATH 62.2: TIME SERIES AND FORECASTING",
+    "MATH 72.1: ORDINARY DIFFERENTIAL EQUATIONS",
+    "MATH 104.1: PROBABILISTIC MACHINE LEARNING I",
+    "MATH 192: UNDERGRADUATE RESEARCH SEMINAR",
+    "CSCI 113i: BUSINESS INTELLIGENCE",
+    "PHILO 13: ETHICS",
+    "THEO 13: A THEOLOGY OF MARRIAGE, FAMILY, AND VOCATION"
+  ],
+  "sects": [
+    "A1",
+    "F",
+    "E",
+    "M",
+    "WXWB2",
+    "J",
+    "G4",
+    "C4"
+  ]
+}
+''')
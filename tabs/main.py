@@ -0,0 +1,297 @@
+''' The Main tab: inputting a schedule, checking it for overlaps, and finding the sections that fit it.'''
+
+import json
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from facile.catalog import load_depts
+from facile.conflicts import open_sections
+from facile.generator import default_weights, generate_schedules, rank_schedules
+from facile.saved import first_row
+from facile.timings import stage
+from facile.timeslots import combine, empty_mask, has_overlap
+from facile.walking import walking_costs
+
+def render(catalog):
+    ''' Shows the tab and returns what the Schedule tab needs of the input.'''
+
+    complete_list = catalog.complete_list
+    _, _, dept_full_names = load_depts()
+
+    df_input = pd.DataFrame(columns=['Department', 'Subject', 'Section'])
+    depts, subjs, sects, mod_scheds, rooms, subj_codes, profs, raw_scheds, display_scheds = [], [], [], [], [], [], [], [], []
+    sched_rows = []
+    nsubjs = 0
+    save_checkbox = st.checkbox('Do you have an existing schedule?',
+                                help = '''If you check this box, there will be a space for you to paste the information about\
+the number of subjects you have, as well as your departments, subjects, and sections. In short, this avoids you having to manually input
+everything. If this is your first time using FACILE, then uncheck the box.''')
+    if save_checkbox:
+        st.subheader('With Existing Schedule')
+        save_str = st.text_input('Paste your existing schedule here, then press Enter:')
+        try:
+            save_dict = json.loads(save_str)
+            st.write(save_dict)
+            nsubjs, depts, subjs, sects = save_dict['nsubjs'], save_dict['depts'], save_dict['subjs'], save_dict['sects']
+            st.write('''Please proceed to the next tab entitled "Schedule" and confirm that the schedule displayed there is correct.
+If there are errors, please check what you pasted, or you can also do the manual input again.''')
+            for i in range(nsubjs):
+                row = first_row(catalog, depts[i], subjs[i], sects[i] if subjs[i] != None else None)
+                index = [row] if row != None else []
+
+                mod_sched = complete_list.iloc[index]['Modified Schedule']
+                mod_scheds.append(mod_sched)
+                sched_rows.append(index)
+                room = complete_list.iloc[index]['Room']
+                rooms.append(room)
+                subj_code = complete_list.iloc[index]['Subject Code']
+                subj_codes.append(subj_code)
+                prof = complete_list.iloc[index]['Instructor']
+                profs.append(prof)
+                raw_sched = complete_list.iloc[index]['Time']
+                raw_scheds.append(raw_sched)
+                display_sched = complete_list.iloc[index]['Display Schedule']
+                display_scheds.append(display_sched)
+        except:
+            print('Please input your previously saved schedule. If the problem persists, message me.')
+            
+    else:
+        st.subheader('Without Existing Schedule')
+        nsubjs = st.number_input('Number of Subjects', 1, 10,
+                             help = 'Input the number of subjects you have, from 1 to 10.')
+        depts, subjs, sects = [], [], []
+        
+        with st.container():
+            col0, col1, col2, col3 = st.columns([0.05, 0.30, 0.45, 0.1])
+            with col0: st.write('No.')
+            with col1: st.markdown('Department', help = 'The department that offers the subject you want to take.')
+            with col2: st.markdown('Subject', help = '''The subject that you want to take.
+        You have to pick the department first before you pick the subject.''')
+            with col3: st.markdown('Section', help = '''The section of a particular subject you want to take.
+        You have to pick the department and subject first before you pick the section.''')
+        for i in range(nsubjs):
+            with st.container():
+                col0, col1, col2, col3 = st.columns([0.05, 0.3, 0.45, 0.1])
+                with col0: st.write(i+1)
+                with col1:
+                    dept = st.selectbox(f'Department {i+1}', dept_full_names,
+                                        index = None, label_visibility = 'collapsed')
+                    depts.append(dept)
+                with col2:
+                    subj = st.selectbox(f'Subject {i+1}', catalog.dept_subjects.get(dept, ()),
+                                        index = None, label_visibility = 'collapsed')
+                    subjs.append(subj)
+                with col3:
+                    sect = st.selectbox(f'Section {i+1}', catalog.subject_sections.get((dept, subj), ()),
+                                        index = None, label_visibility = 'collapsed')
+                    sects.append(sect)
+
+            row = catalog.section_row.get((dept, subj, sect)) if sect != None else None
+            index = [row] if row != None else []
+        
+            mod_sched = complete_list.iloc[index]['Modified Schedule']
+            mod_scheds.append(mod_sched)
+            sched_rows.append(index)
+            room = complete_list.iloc[index]['Room']
+            rooms.append(room)
+            subj_code = complete_list.iloc[index]['Subject Code']
+            subj_codes.append(subj_code)
+            prof = complete_list.iloc[index]['Instructor']
+            profs.append(prof)
+            raw_sched = complete_list.iloc[index]['Time']
+            raw_scheds.append(raw_sched)
+            display_sched = complete_list.iloc[index]['Display Schedule']
+            display_scheds.append(display_sched)
+        
+    mod_scheds = [mod_sched.iloc[0] if len(mod_sched) > 0 else [] for mod_sched in mod_scheds]
+    sched_rows = [index[0] if len(index) > 0 else None for index in sched_rows]
+    sched_masks = np.array([catalog.masks[row] if row != None else empty_mask for row in sched_rows], dtype = np.uint64)
+    rooms = [room.iloc[0] if len(room) > 0 else '' for room in rooms]
+    subj_codes = [subj_code.iloc[0] if len(subj_code) > 0 else '' for subj_code in subj_codes]
+    profs = [prof.iloc[0] if len(prof) > 0 else '' for prof in profs]
+    raw_scheds = [raw_sched.iloc[0] if len(raw_sched) > 0 else '' for raw_sched in raw_scheds]
+    display_scheds = [display_sched.iloc[0] if len(display_sched) > 0 else '' for display_sched in display_scheds]
+
+    summary = None
+    try:
+        summary = pd.DataFrame({'Department' : depts,
+                                'Subject Code and Name' : subjs,
+                                'Section' : sects,
+                                'Modified Schedule' : mod_scheds,
+                                'Room' : rooms,
+                                'Subject Code' : subj_codes,
+                                'Professor(s)' : profs,
+                                'Raw Schedule' : raw_scheds,
+                                'Display Schedule' : display_scheds},
+                               index = np.arange(1, nsubjs+1))
+    except:
+        st.write('Please ensure that your input is correct.')
+
+    # st.write(summary)
+
+    # Checking for Overlaps
+
+    st.subheader('Information Regarding Overlaps')
+    if depts == [] or depts == [None for _ in range(nsubjs)]:
+        duplicates = 'N/A'
+        st.write('You have not inputted anything yet.')
+    elif has_overlap(sched_masks):
+        duplicates = True
+        st.write('There are overlaps in your schedule.')
+    else:
+        duplicates = False
+        st.write('There are no overlaps in your schedule.')
+
+    # Departments / Subjects to Filter By
+    
+    st.subheader('Active Department / Subject')
+    early_late_checkbox = st.checkbox('Do you want to highlight early and late classes? (Early - Maroon Text, Late - Orange Text)')
+    fili_checkbox = st.checkbox('Do you want to highlight Filipino classes? (PHILO 11, 12, 13, and DLQ) (Light Blue Highlight)')
+
+    def formatter(x):
+        early_filipino = 'color:#AA336A;background-color:#ADD8E6'
+        late_filipino = 'color:#FF8C00;background-color:#ADD8E6'
+        early = 'color:#AA336A'
+        late = 'color:#FF8C00'
+        filipino = 'background-color:#ADD8E6'
+        empty = ''
+
+        mask1 = (x['is_early'] == True) & (x['Lang'] == 'FIL')
+        mask2 = (x['is_late'] == True) & (x['Lang'] == 'FIL')
+        mask3 = (x['is_early'] == True) & (x['Lang'] != 'FIL')
+        mask4 = (x['is_late'] == True) & (x['Lang'] != 'FIL')
+        mask5 = (x['is_early'] == False) & (x['is_late'] == False) & (x['Lang'] == 'FIL')
+        mask6 = (x['is_early'] == True)
+        mask7 = (x['is_late'] == True)
+        mask8 = (x['Lang'] == 'FIL')
+        # mask9 = (x['is_early'] == False) & (x['is_late'] == False) & (x['Lang'] != 'FIL')
+
+        complete_list_styled = pd.DataFrame(empty, index = x.index, columns = x.columns)
+        if early_late_checkbox and fili_checkbox:
+            complete_list_styled.loc[mask1, :] = early_filipino
+            complete_list_styled.loc[mask2, :] = late_filipino
+            complete_list_styled.loc[mask3, :] = early
+            complete_list_styled.loc[mask4, :] = late
+            complete_list_styled.loc[mask5, :] = filipino
+        elif early_late_checkbox:
+            complete_list_styled.loc[mask6, :] = early
+            complete_list_styled.loc[mask7, :] = late
+        elif fili_checkbox:
+            complete_list_styled.loc[mask8, :] = filipino
+
+        return complete_list_styled
+    
+    filter_list = []
+    filter_cat = []
+    for i in range(nsubjs):
+        if depts[i] == None:
+            filter_list.append(None)
+            filter_cat.append(None)
+        elif subjs[i] == None:
+            filter_list.append(depts[i])
+            filter_cat.append('Department')
+        elif sects[i] == None:
+            filter_list.append(subjs[i])
+            filter_cat.append('Subject')
+        else:
+            filter_list.append(None)
+            filter_cat.append('Section')
+    filter_df = pd.DataFrame({'Filter By' : filter_list, 'Filter Category' : filter_cat},
+                             index = np.arange(1, nsubjs + 1))
+    # st.dataframe(filter_df)
+
+    def display_subjects(input_dept):
+        # st.write(f'Here are all the subjects offered by the Department of {input_dept}:')
+        is_open = open_sections(catalog, sched_masks, complete_list['Department'] == input_dept)
+        st.write(f'Here are the subjects offered by the Department of {input_dept} that have no conflicts with your schedule:')
+        filtered_subjects = complete_list[is_open]
+        filtered_subjects_display = filtered_subjects.drop(['Department', 'Modified Schedule',
+                                                       'Subject Code and Name', 'Display Schedule'], axis = 1).astype({'Units' : 'int'})
+        st.dataframe(filtered_subjects_display.style.apply(formatter, axis = None))
+
+    def display_sections(input_subj):
+        # st.write(f'Here are all the sections for {input_subj}:')
+        index = summary[summary['Subject Code and Name'] == input_subj].index
+        dept_of_subj = summary['Department'].iloc[index-1].iloc[0]
+        is_open = open_sections(catalog, sched_masks, (complete_list['Department'] == dept_of_subj) &
+                                                      (complete_list['Subject Code and Name'] == input_subj))
+        st.write(f'Here are the sections for {input_subj} that have no conflicts with your schedule:')
+        filtered_sections = complete_list[is_open]
+        filtered_sections_display = filtered_sections.drop(['Department', 'Modified Schedule',
+                                                       'Subject Code and Name', 'Display Schedule'], axis = 1).astype({'Units' : 'int'})
+        st.dataframe(filtered_sections_display.style.apply(formatter, axis = None))
+
+    if depts == [] or depts == [None for _ in range(nsubjs)]:
+        st.write('You have not inputted anything yet.')
+    else:
+        active_list = st.multiselect('Select the Active Department(s) / Subject(s)', filter_df['Filter By'].dropna(), filter_df['Filter By'].dropna(),
+                                     help = '''If you mark a department as active, you can see the subjects they offer that are compatible
+        with your schedule. (This is helpful for PE and Major Electives, for example.)
+        If you mark a subject as active, you can see the sections for it that are compatible with your schedule.''')
+
+        for deptsubj in active_list:
+            if deptsubj not in list(dept_full_names): display_sections(deptsubj)
+            else: display_subjects(deptsubj)
+
+    st.subheader('Generate Schedules')
+    gen_subjects = [(depts[i], subjs[i]) for i in range(nsubjs) if filter_cat[i] == 'Subject']
+    if gen_subjects == []:
+        st.write('Input subjects without sections to generate the schedules that have no overlaps.')
+    else:
+        gen_checkbox = st.checkbox('Do you want to generate schedules for the subjects without sections?',
+                                   help = '''FACILE will list the combinations of sections for these subjects that have no overlaps
+with each other and with the sections you have already chosen.''')
+        if gen_checkbox:
+            gen_limit = st.number_input('Maximum Number of Schedules', 1, 1000, 100,
+                                        help = 'Input the maximum number of schedules to list, from 1 to 1000.')
+            rank_checkbox = st.checkbox('Do you want to rank the schedules by your preferences?',
+                                        help = '''The schedules with the fewest early and late classes, free time between classes,
+and days on campus will be listed first.''')
+            if rank_checkbox:
+                col0, col1, col2, col3, col4, col5 = st.columns(6)
+                with col0: avoid_early = st.checkbox('Avoid early classes', value = True)
+                with col1: avoid_late = st.checkbox('Avoid late classes', value = True)
+                with col2: avoid_gaps = st.checkbox('Avoid free time between classes', value = True)
+                with col3: avoid_days = st.checkbox('Avoid more days on campus', value = True)
+                with col4: avoid_walks = st.checkbox('Avoid long walks between classes', value = True,
+                                                     help = 'Especially between back-to-back classes in buildings far apart.')
+                with col5: fili_pref = st.selectbox('Filipino classes', ['No preference', 'Prefer', 'Avoid'])
+                weights = {'early' : default_weights['early'] * avoid_early,
+                           'late' : default_weights['late'] * avoid_late,
+                           'gaps' : default_weights['gaps'] * avoid_gaps,
+                           'days' : default_weights['days'] * avoid_days,
+                           'walking' : default_weights['walking'] * avoid_walks,
+                           'tight' : default_weights['tight'] * avoid_walks,
+                           'filipino' : {'No preference' : 0, 'Prefer' : -1, 'Avoid' : 1}[fili_pref]}
+
+            fixed_rows = [i for i in range(nsubjs) if filter_cat[i] == 'Section']
+            fixed_row_ids = tuple(sched_rows[i] for i in fixed_rows if sched_rows[i] != None)
+            with stage('generate schedules'):
+                if rank_checkbox:
+                    ranked = rank_schedules(catalog, gen_subjects, combine(sched_masks[fixed_rows]), gen_limit, weights, fixed_row_ids)
+                    generated = [rows for score, rows in ranked]
+                else:
+                    generated = list(generate_schedules(catalog, gen_subjects, combine(sched_masks[fixed_rows]), gen_limit))
+            if generated == []:
+                st.write('There are no schedules without overlaps for these subjects.')
+            else:
+                gen_sections = complete_list['Section'].to_numpy()[np.array(generated)]
+                gen_df = pd.DataFrame(gen_sections, columns = [subj.split(':')[0] for dept, subj in gen_subjects],
+                                      index = np.arange(1, len(generated) + 1))
+                gen_df['Walking (m)'], gen_df['Tight Transfers'] = walking_costs(catalog.slot_bldgs,
+                                                                                 [rows + fixed_row_ids for rows in generated])
+                gen_df['Walking (m)'] = gen_df['Walking (m)'].round().astype(int)
+                if rank_checkbox:
+                    gen_df['Score'] = [score for score, rows in ranked]
+                st.write(f'Here are {len(generated)} schedule(s) without overlaps:')
+                st.dataframe(gen_df)
+
+    st.subheader('Copy Paste')
+    st.write('You can copy the box below, so that if you want to use FACILE next time, you can paste this information\
+             instead of having to manually input each department, subject, and section.')
+    copy = {'nsubjs' : nsubjs, 'depts' : depts, 'subjs' : subjs, 'sects' : sects}
+    st.write(copy) #st.code(copy)
+
+    return {'nsubjs' : nsubjs, 'sects' : sects, 'sched_rows' : sched_rows, 'summary' : summary, 'duplicates' : duplicates}
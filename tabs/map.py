@@ -0,0 +1,63 @@
+''' The Map tab: the buildings of the rooms and where the buildings are.'''
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+from facile.buildings import bldg_coords, walking_order
+from facile.campus_map import MAP_HEIGHT, MAP_WIDTH, overlay_script, render_base_map, route_points, with_overlay
+from facile.meetings import meetings_of
+from facile.timings import stage
+
+@st.cache_resource(show_spinner = False)
+def get_base_map():
+    ''' Renders the base map once per process; overlays are added to a copy of the page.'''
+    return render_base_map()
+
+def schedule_walks(catalog, sched_rows):
+    ''' Returns the walking order of the meetings of the given rows of complete_list.'''
+
+    meetings = catalog.meetings.iloc[meetings_of(catalog, sched_rows)]
+    return walking_order(meetings, catalog.meeting_masks[meetings.index], catalog.room_bldg)
+
+def render(catalog, selection = None):
+    ''' Shows the tab, with the walking routes of the selection returned by tabs.main.render.'''
+
+    complete_rooms = catalog.complete_rooms
+    st.subheader('Room & Buildling Shorcuts Table')
+    st.write(complete_rooms)
+
+    complete_bldgs = pd.Series(complete_rooms['Building'].unique()).sort_values()\
+                     .reset_index().rename(columns = {0 : 'Building'}).drop(columns = ['index'])
+    # st.table(complete_bldgs)
+    
+    
+    bldg_coords_df = pd.DataFrame(bldg_coords, columns = ['Building', 'Abbreviation', 'Latitude', 'Longitude'])
+
+    st.subheader('Ateneo Map')
+    highlight_rooms = st.multiselect('Which rooms do you want to find on the map?', complete_rooms['Room'])
+    show_routes = st.checkbox('Show the walk between the classes of the schedule in the Main tab, in order each day')
+    highlights = [catalog.room_bldg[room] for room in highlight_rooms]
+    routes = []
+    sched_rows = [row for row in selection['sched_rows'] if row != None] if selection != None else []
+    if show_routes and sched_rows != []:
+        routes = route_points(schedule_walks(catalog, sched_rows))
+        for route in routes:
+            st.write(route['label'])
+        if routes == []:
+            st.write('Each day, your classes are in one building on the map.')
+    elif show_routes:
+        st.write('Please input a section.')
+
+    with stage('folium map'):
+        page, map_name = get_base_map()
+        if highlights != [] or routes != []:
+            page = with_overlay(page, overlay_script(map_name, highlights, routes))
+        components.html(page, height = MAP_HEIGHT + 10, width = MAP_WIDTH)
+
+    bldg_details_display = bldg_coords_df[['Building', 'Abbreviation']]
+    bldg_details_display['Number'] = np.arange(1, len(bldg_details_display)+1)
+    bldg_details_display = bldg_details_display.set_index(bldg_details_display['Number'])
+    bldg_details_display = bldg_details_display.drop(columns = ['Number'])
+    st.table(bldg_details_display)
@@ -0,0 +1,52 @@
+''' The Prof Locator tab: the schedule of a professor, what each professor teaches, and professors booked twice at the
+same time.'''
+
+import streamlit as st
+
+from facile.grid import schedule_grid
+from facile.meetings import meetings_of
+
+def render(catalog):
+    ''' Shows the tab.'''
+
+    prof_input = st.selectbox('Which professor\'s schedule do you want to find?', list(catalog.prof_index), index = None,
+                              help = '''Note that these subjects and rooms are only based on AISIS.
+There may be anomalies here, such as a TBA classroom not being updated, or a class having been moved to a different room.
+Please ask the department secretary for more accurate and timely information.''')
+    
+    st.subheader('Professor Schedule Summary')
+    try:
+        prof_summary = catalog.complete_list.iloc[catalog.prof_index[prof_input]]
+        # st.write(prof_summary)
+        display_prof_summary = prof_summary[['Subject Code and Name', 'Section', 'Room', 'Instructor', 'Time']]
+        st.write(display_prof_summary)
+        prof_meetings = catalog.meetings.iloc[meetings_of(catalog, catalog.prof_index[prof_input])]
+        prof_schedule_table = schedule_grid(prof_meetings['Display Schedule'], catalog.meeting_masks[prof_meetings.index])
+    except:
+        st.write('You have not input anything, or your input is incorrect. Please try again.')
+
+    st.subheader('Professor Schedule Table')
+    try:
+        if (prof_schedule_table == '').all(axis = None):
+            st.write('This professor only teaches classes with no specific timeslots (e.g. thesis or graduate school classes).')
+        else:
+            st.table(prof_schedule_table)
+        
+    except:
+        st.write('You have not input anything, or your input is incorrect. Please try again.')
+
+    st.subheader('Subjects and Departments Taught By Professors')
+    st.write(catalog.teaching_load)
+
+    st.subheader('Double-Booked Professors')
+    bookings = catalog.double_bookings
+    prof_bookings = bookings[bookings['Kind'] == 'Instructor'].drop(columns = ['Kind']).rename(columns = {'Booked' : 'Instructor'})
+    if prof_bookings.empty:
+        st.write('No professor teaches two classes at the same time, according to AISIS.')
+    else:
+        st.write(f'{len(prof_bookings)} pair(s) of classes are taught by the same professor at the same time, according to AISIS. '
+                 'Many are classes held together, such as undergraduate and graduate versions of a course.')
+        st.dataframe(prof_bookings, hide_index = True, use_container_width = True)
+
+    # more_than_one_prof = prof_unique[prof_unique['Professor'].str.count(',') > 2].reset_index().drop(columns = ['index'])
+    # st.write(more_than_one_prof)
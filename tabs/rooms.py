@@ -0,0 +1,76 @@
+''' The Classroom Checker tab: the schedule of a room, free rooms, and rooms booked twice at the same time.'''
+
+import streamlit as st
+
+from facile.buildings import bldg_number
+from facile.grid import day_names, schedule_grid
+from facile.meetings import meetings_of
+from facile.occupancy import free_rooms, free_windows, window_slots
+from facile.timeslots import NSLOTS
+
+def render(catalog):
+    ''' Shows the tab.'''
+
+    room_unique = catalog.room_unique
+    
+    room_input = st.selectbox('Which room\'s schedule do you want to find?', room_unique, index = None,
+                              help = '''Note that these subjects and rooms are only based on AISIS.
+There may be anomalies here, such as a TBA classroom not being updated, or a class having been moved to a different room.
+Please ask the department secretary for more accurate and timely information.''')
+
+    st.subheader('Room Schedule Summary')
+    try:
+        room_summary = catalog.complete_list.iloc[catalog.room_index[room_input]]
+        # st.write(room_summary)
+        display_room_summary = room_summary[['Subject Code and Name', 'Section', 'Room', 'Instructor', 'Time']]
+        st.write(display_room_summary)
+        bldg = catalog.room_bldg[room_input]
+        st.write(f'Building: {bldg}' + (f' (number {bldg_number(bldg)} on the Map tab)' if bldg_number(bldg) != None else ''))
+        room_meetings = catalog.meetings.iloc[meetings_of(catalog, catalog.room_index[room_input])]
+        room_meetings = room_meetings[room_meetings['Room'] == room_input]
+        room_schedule_table = schedule_grid(room_meetings['Subject Code'] + ' ' + room_meetings['Section'],
+                                            catalog.meeting_masks[room_meetings.index])
+    except:
+        st.write('You have not input anything, or your input is incorrect. Please try again.')
+
+    st.subheader('Room Schedule Table')
+    try:
+        if (room_schedule_table == '').all(axis = None):
+            st.write('This room is empty.')
+        else:
+            st.table(room_schedule_table)
+    except:
+        st.write('You have not input anything, or your input is incorrect. Please try again.')
+
+    st.subheader('Find a Free Room')
+    times = [f'{700 + slot // 2 * 100 + slot % 2 * 30:04}' for slot in range(NSLOTS + 1)] #to 2200, the end of the last slot
+    col0, col1, col2, col3 = st.columns(4)
+    with col0: free_day = st.selectbox('Day', day_names)
+    with col1: free_start = st.selectbox('From', times[:-1], index = times.index('1300'))
+    with col2: free_end = st.selectbox('To', times[1:], index = times.index('1430') - 1)
+    with col3: free_bldg = st.selectbox('Building', ['Any'] + sorted(catalog.complete_rooms['Building'].unique()))
+    free_bldg = None if free_bldg == 'Any' else free_bldg
+    show_windows = st.checkbox('Show every free stretch of the rooms that day instead',
+                               help = 'Lists when each room has no class between From and To, for stretches of at least 30 minutes.')
+
+    if int(free_end) <= int(free_start):
+        st.write('Please choose a time To after the time From.')
+    elif show_windows:
+        st.dataframe(free_windows(catalog, day_names.index(free_day), int(free_start), int(free_end), bldg = free_bldg),
+                     hide_index = True, use_container_width = True)
+    else:
+        rooms_free = free_rooms(catalog, window_slots(day_names.index(free_day), int(free_start), int(free_end)), free_bldg)
+        if rooms_free.empty:
+            st.write('No room is free then.')
+        else:
+            st.write(f'{len(rooms_free)} room(s) have no class then, according to AISIS:')
+            st.dataframe(rooms_free, hide_index = True, use_container_width = True)
+
+    st.subheader('Double-Booked Rooms')
+    bookings = catalog.double_bookings
+    room_bookings = bookings[bookings['Kind'] == 'Room'].drop(columns = ['Kind']).rename(columns = {'Booked' : 'Room'})
+    if room_bookings.empty:
+        st.write('No room has two classes at the same time, according to AISIS.')
+    else:
+        st.write(f'{len(room_bookings)} pair(s) of classes are held in the same room at the same time, according to AISIS:')
+        st.dataframe(room_bookings, hide_index = True, use_container_width = True)
@@ -0,0 +1,51 @@
+''' The Schedule tab: the summary and weekly table of the schedule input in the Main tab.'''
+
+import streamlit as st
+
+from facile.buildings import walking_order
+from facile.grid import day_names, schedule_grid
+from facile.meetings import meetings_of
+from facile.walking import TIGHT_DISTANCE, schedule_transfers
+
+def render(catalog, selection):
+    ''' Shows the tab for the selection returned by tabs.main.render.'''
+
+    nsubjs, sects, sched_rows, summary, duplicates = [selection[key] for key in ['nsubjs', 'sects', 'sched_rows', 'summary', 'duplicates']]
+
+    if duplicates == 'N/A':
+        st.write('Please input your schedule.')
+    if duplicates == True:
+        st.write('Please remove overlaps from your schedule first before proceeding to this tab.')
+    else:
+        st.subheader('Schedule Summary')
+        if sects == [] or sects == [None for _ in range(nsubjs)]:
+            st.write('Please input a section.')
+        else:
+            display_summary = summary.drop(['Department', 'Subject Code', 'Modified Schedule', 'Display Schedule'], axis = 1)
+            st.dataframe(display_summary, use_container_width = True)     
+
+            hidden_summary = catalog.meetings.iloc[meetings_of(catalog, [row for row in sched_rows if row != None])]
+            # st.write(hidden_summary)
+
+            schedule_table = schedule_grid(hidden_summary['Display Schedule'], catalog.meeting_masks[hidden_summary.index])
+            transfers = schedule_transfers(walking_order(hidden_summary, catalog.meeting_masks[hidden_summary.index], catalog.room_bldg))
+
+        st.subheader('Schedule Table')
+        if sects == [] or sects == [None for _ in range(nsubjs)]:
+            st.write('Please input a section.')
+        else:
+            st.table(schedule_table)
+
+        st.subheader('Walks Between Classes')
+        if sects == [] or sects == [None for _ in range(nsubjs)]:
+            st.write('Please input a section.')
+        elif transfers.empty:
+            st.write('You have at most one class each day.')
+        else:
+            n_tight = int(transfers['Tight'].sum())
+            if n_tight > 0:
+                st.write(f'{n_tight} of your back-to-back classes are more than {TIGHT_DISTANCE} m apart (in a straight line), so you may be late for them.')
+            else:
+                st.write('None of your back-to-back classes are far apart.')
+            st.dataframe(transfers.assign(Day = [day_names[day] for day in transfers['Day']]), hide_index = True,
+                         use_container_width = True)
@@ -0,0 +1,11 @@
+import os
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(autouse = True)
+def repo_dir(monkeypatch):
+    ''' Runs each test from the repository, where depts.csv, prefixes.csv and the snapshot folders are.'''
+
+    monkeypatch.chdir(REPO)
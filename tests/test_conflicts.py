@@ -0,0 +1,38 @@
+''' The rooms and professors booked twice at the same time in a hand-made catalog.'''
+
+import pandas as pd
+
+from facile.conflicts import booking_columns, double_bookings
+from facile.indexes import build_prof_index
+from facile.meetings import build_meetings
+from facile.timeslots import parse_masks
+
+SECTIONS = [ # Subject Code, Section, Time, Room, Instructor
+    ('MATH 10', 'A', 'M-TH 0800-0930', 'SEC-A101', 'CRUZ, JUAN'),
+    ('PHYS 1', 'B', 'TH 0900-1000', 'SEC-A101', 'SANTOS, MARIA'), #in SEC-A101 with MATH 10 A on TH 0900-0930
+    ('ENGL 11', 'C', 'T-F 0800-0930', 'CTC-201', 'CRUZ, JUAN'), #on other days than MATH 10 A
+    ('HIST 1', 'D', 'M 0830-1000', 'TBA', 'CRUZ, JUAN'), #taught with MATH 10 A on M 0830-0930
+    ('FIL 11', 'E', 'M 0800-0930', 'TBA', 'TBA, -'), #at the same time as FIL 12 F, in no room and with no professor yet
+    ('FIL 12', 'F', 'M 0800-0930', 'TBA', 'TBA, -'),
+    ('IDS 180', 'A', 'W 1300-1600', 'SEC-A102', 'REYES, ANA'), #as all_ies lists it
+    ('IDS 180', 'A', 'W 1300-1600', 'SEC-A102', 'REYES, ANA'), #as its home department lists it
+    ('SOCSC 11', 'A', 'W 1500-1600; F 1500-1600', 'SEC-A102; SEC-A103', 'REYES, ANA, LIM, ROSA'),
+]
+ROOMS = pd.Series(['CTC-201', 'SEC-A101', 'SEC-A102', 'SEC-A103'])
+
+def test_double_bookings():
+    complete_list = pd.DataFrame(SECTIONS, columns = ['Subject Code', 'Section', 'Time', 'Room', 'Instructor'])
+    complete_list['Department'] = 'Test'
+    complete_list['Subject Code and Name'] = complete_list['Subject Code']
+    meetings, meeting_masks = build_meetings(complete_list)
+
+    bookings = double_bookings(complete_list, parse_masks(complete_list['Time']), meetings, meeting_masks,
+                               build_prof_index(complete_list), ROOMS)
+    assert list(bookings.columns) == booking_columns
+    assert bookings.drop(columns = ['Time 1', 'Time 2']).values.tolist() == [
+        ['Instructor', 'CRUZ, JUAN', 'HIST 1', 'D', 'MATH 10', 'A', 60],
+        ['Instructor', 'REYES, ANA', 'IDS 180', 'A', 'SOCSC 11', 'A', 60],
+        ['Room', 'SEC-A101', 'MATH 10', 'A', 'PHYS 1', 'B', 30],
+        ['Room', 'SEC-A102', 'IDS 180', 'A', 'SOCSC 11', 'A', 60],
+    ]
+    assert bookings['Time 2'].tolist()[2:] == ['TH 0900-1000', 'W 1500-1600; F 1500-1600']
@@ -0,0 +1,47 @@
+''' Comparing two snapshots section by section, with the sections that all_ies lists again.'''
+
+import numpy as np
+import pandas as pd
+
+from facile.diff import diff_snapshots, unique_sections
+
+def snapshot(rows):
+    ''' A complete list of (Subject Code, Section, Time, Room, Instructor, Free Slots) rows, with the room and instructor
+    as categoricals like the catalog has them.'''
+
+    complete_list = pd.DataFrame(rows, columns = ['Subject Code', 'Section', 'Time', 'Room', 'Instructor', 'Free Slots'])
+    return complete_list.astype({'Room' : 'category', 'Instructor' : 'category'})
+
+OLD = snapshot([
+    ('IDS 180', 'A', 'M-TH 0800-0930', 'SEC-A117', 'CRUZ, JUAN', 10), #as all_ies lists it, before its home department
+    ('MATH 10', 'A', 'T-F 0930-1100', 'SEC-B201', 'SANTOS, MARIA', 5),
+    ('MATH 10', 'B', 'W 1300-1600', 'SEC-B202', 'TBA, -', 3),
+    ('IDS 180', 'A', 'M-TH 0800-0930', 'SEC-A118', 'CRUZ, JUAN', 10),
+    ('PHYS 1', 'C', 'TBA', np.nan, 'REYES, ANA', 0),
+])
+NEW = snapshot([
+    ('IDS 180', 'A', 'M-TH 0800-0930', 'SEC-A120', 'CRUZ, JUAN', 10),
+    ('MATH 10', 'A', 'T-F 0930-1100', 'SEC-B201', 'SANTOS, MARIA', 2),
+    ('IDS 180', 'A', 'M-TH 0800-0930', 'SEC-A118', 'CRUZ, JUAN', 10),
+    ('PHYS 1', 'C', 'TBA', np.nan, 'REYES, ANA', 0),
+    ('ENGL 11', 'D', 'SAT 0800-1100', 'CTC-102', 'LIM, ROSA', 20),
+])
+
+def test_unique_sections_keeps_last_row():
+    sections = unique_sections(OLD)
+    assert len(sections) == 4
+    assert sections.loc[sections['Subject Code'] == 'IDS 180', 'Room'].tolist() == ['SEC-A118']
+
+def test_diff_snapshots():
+    diff = diff_snapshots(OLD, NEW)
+    assert diff[['Subject Code', 'Section', 'Status', 'Changes']].values.tolist() == [
+        ['ENGL 11', 'D', 'Added', ''],
+        ['MATH 10', 'A', 'Changed', 'Free Slots'],
+        ['MATH 10', 'B', 'Removed', ''],
+    ] #IDS 180 A is in SEC-A118 in both, once the all_ies rows are collapsed, and PHYS 1 C has no room in either
+    assert diff['Free Slots Delta'].tolist() == [pd.NA, -3, pd.NA]
+    assert diff['Room (new)'].tolist()[:2] == ['CTC-102', 'SEC-B201']
+    assert pd.isna(diff['Room (old)'][0]) and pd.isna(diff['Room (new)'][2])
+
+def test_diff_snapshots_of_same_snapshot_is_empty():
+    assert len(diff_snapshots(OLD, OLD)) == 0
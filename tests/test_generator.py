@@ -0,0 +1,95 @@
+''' Ranking schedules with the walks between classes, against scoring every schedule, and how long it takes.'''
+
+import itertools
+import os
+import time
+
+import numpy as np
+import pytest
+
+from facile.catalog import load_catalog
+from facile.generator import default_weights, rank_schedules
+from facile.timeslots import campus_days, combine, gap_slots, mask_ints
+from facile.walking import walking_costs
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FOLDER = 'schedules_2024-1_20240704_2024'
+
+@pytest.fixture(scope = 'module')
+def catalog():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(REPO)
+        return load_catalog(FOLDER)
+
+def subject_sections(catalog):
+    ''' Returns the number of sections with times of each (department, subject code and name) pair, most first.'''
+
+    complete_list = catalog.complete_list[catalog.masks.any(axis = 1)]
+    counts = complete_list.groupby(['Department', 'Subject Code and Name'], observed = True).size()
+    return counts.sort_values(ascending = False, kind = 'stable')
+
+def scores(catalog, schedules, weights, fixed_rows = ()):
+    ''' Scores schedules (tuples of row ids) the way rank_schedules does.'''
+
+    weights = {**default_weights, **weights}
+    complete_list = catalog.complete_list
+    row_costs = (weights['early'] * complete_list['is_early'].to_numpy() + weights['late'] * complete_list['is_late'].to_numpy()
+                 + weights['filipino'] * (complete_list['Lang'] == 'FIL').to_numpy())
+    used = [combine(catalog.masks[list(rows) + list(fixed_rows)]) for rows in schedules]
+    distances, tight = walking_costs(catalog.slot_bldgs, [tuple(rows) + tuple(fixed_rows) for rows in schedules])
+    return np.array([row_costs[list(rows)].sum() + weights['days'] * campus_days(mask_ints(mask)[0])
+                     + weights['gaps'] * gap_slots(mask_ints(mask)[0]).bit_count() for rows, mask in zip(schedules, used)]
+                    + weights['walking'] * distances / 100 + weights['tight'] * tight)
+
+def brute_force(catalog, subjects, weights, fixed_rows = ()):
+    ''' Returns the scores of every schedule without overlaps of subjects, from best to worst.'''
+
+    complete_list = catalog.complete_list
+    options = [np.flatnonzero((complete_list['Department'] == dept) & (complete_list['Subject Code and Name'] == subj))
+               for dept, subj in subjects]
+    schedules = []
+    for rows in itertools.product(*options):
+        masks = mask_ints(catalog.masks[list(rows) + list(fixed_rows)])
+        used = 0
+        for mask in masks:
+            if mask & used: break
+            used |= mask
+        else:
+            schedules.append(rows)
+    return np.sort(scores(catalog, schedules, weights, fixed_rows))
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('weights', [{}, {'walking' : 5, 'tight' : 0}, {'walking' : 0, 'tight' : 3, 'filipino' : -1},
+                                     {'walking' : 2, 'tight' : 4, 'days' : 0, 'gaps' : 0}])
+def test_rank_schedules_matches_brute_force(catalog, seed, weights):
+    counts = subject_sections(catalog)
+    pool = list(counts[(counts >= 3) & (counts <= 7)].index)
+    rng = np.random.default_rng(seed)
+    subjects = [pool[i] for i in rng.choice(len(pool), 5, replace = False)]
+    fixed_rows = (int(rng.choice(np.flatnonzero(catalog.masks.any(axis = 1)))),) if seed % 2 else ()
+    fixed_mask = combine(catalog.masks[list(fixed_rows)])
+
+    expected = brute_force(catalog, subjects, weights, fixed_rows)
+    ranked = rank_schedules(catalog, subjects, fixed_mask, 10, weights, fixed_rows)
+    assert len(ranked) == min(10, len(expected))
+    assert np.allclose([score for score, _ in ranked], expected[:10])
+    schedules = [rows for _, rows in ranked]
+    assert np.allclose(scores(catalog, schedules, weights, fixed_rows), [score for score, _ in ranked])
+    for rows in schedules:
+        assert [tuple(catalog.complete_list.loc[row, ['Department', 'Subject Code and Name']]) for row in rows] == subjects
+
+def test_rank_schedules_returns_every_schedule_when_k_is_large(catalog):
+    counts = subject_sections(catalog)
+    subjects = list(counts[(counts >= 3) & (counts <= 4)].index[:3])
+    expected = brute_force(catalog, subjects, {})
+    ranked = rank_schedules(catalog, subjects, k = len(expected) + 5)
+    assert np.allclose([score for score, _ in ranked], expected)
+    assert len(set(rows for _, rows in ranked)) == len(expected)
+
+@pytest.mark.parametrize('n, max_seconds', [(8, 2), (10, 4)]) #about twice the time they take
+def test_rank_schedules_with_walks_is_fast(catalog, n, max_seconds):
+    subjects = list(subject_sections(catalog).index[:n])
+    start = time.perf_counter()
+    ranked = rank_schedules(catalog, subjects, k = 10)
+    assert time.perf_counter() - start < max_seconds
+    assert len(ranked) == 10
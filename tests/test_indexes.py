@@ -0,0 +1,35 @@
+''' Splitting real AISIS Instructor entries into professors.'''
+
+import pandas as pd
+import pytest
+
+from facile.indexes import TBA, build_prof_index, split_instructors
+
+@pytest.mark.parametrize('instructor, names', [
+    ('RAGAZA, JANICE A.', ['RAGAZA, JANICE A.']),
+    ('GO, SJ, JOHNNY C.', ['GO, SJ, JOHNNY C.']),
+    ('ABAIS, S.J., FR. ROGEL ANECITO L.', ['ABAIS, S.J., FR. ROGEL ANECITO L.']),
+    ('BENNETT, CLINT DOMINIC G., SUGON, JR., QUIRINO M.', ['BENNETT, CLINT DOMINIC G.', 'SUGON, JR., QUIRINO M.']),
+    ('BEJA, EDSEL, JR. L.', ['BEJA, EDSEL, JR. L.']),
+    ('BEJA, EDSEL, JR. L., DUCANES, Geoffrey', ['BEJA, EDSEL, JR. L.', 'DUCANES, Geoffrey']),
+    ('FERNANDEZ, PROCESO, JR. L., MACABEBE, EREES QUEEN B.', ['FERNANDEZ, PROCESO, JR. L.', 'MACABEBE, EREES QUEEN B.']),
+    ('FUNG, FR. JOJO, S.J., NONO, Grace, PORIO, EMMA E.', ['FUNG, FR. JOJO, S.J.', 'NONO, Grace', 'PORIO, EMMA E.']),
+    ('GONZALES, FR. TEODULO, S.J.', ['GONZALES, FR. TEODULO, S.J.']),
+    ('EUSEBIO, FR. ENRICO, JR. SJ', ['EUSEBIO, FR. ENRICO, JR. SJ']),
+    ('MARAMARA, MELISSA VERA M., YEE, CHARLES IVAN, JR.', ['MARAMARA, MELISSA VERA M.', 'YEE, CHARLES IVAN, JR.']),
+    ('REYES, SALVADOR JR., S.', ['REYES, SALVADOR JR., S.']),
+    ('CO, SR. MA. ANICIA', ['CO, SR. MA. ANICIA']),
+    ('TBA, -', [TBA]),
+    ('TBA, -, TORRES, Wilfredo', [TBA, 'TORRES, Wilfredo']),
+    ('TO BE ARRANGED', [TBA]),
+])
+def test_split_instructors(instructor, names):
+    assert split_instructors(instructor) == names
+
+def test_prof_index_has_no_suffix_or_tba_phantoms():
+    complete_list = pd.DataFrame({'Instructor' : ['BEJA, EDSEL, JR. L., DUCANES, Geoffrey', 'DUCANES, Geoffrey',
+                                                  'FUNG, FR. JOJO, S.J.', 'TO BE ARRANGED', 'TBA, -', None]})
+    prof_index = build_prof_index(complete_list)
+    assert sorted(prof_index) == ['BEJA, EDSEL, JR. L.', 'DUCANES, Geoffrey', 'FUNG, FR. JOJO, S.J.', TBA]
+    assert prof_index['DUCANES, Geoffrey'].tolist() == [0, 1]
+    assert prof_index[TBA].tolist() == [3, 4]
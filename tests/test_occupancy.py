@@ -0,0 +1,64 @@
+''' The free rooms and free windows of a hand-made schedule: SEC-A101 has classes on M-TH 0800-0930, W 2030-2200 (up
+to the last slot), SAT 0700-1000 and F 1600-1700 (shared with CTC-201), CTC-201 on T-F 1300-1430, and SEC-A102 has none.'''
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from facile.occupancy import build_occupancy, free_rooms, free_windows, window_slots
+from facile.timeslots import parse_masks
+
+MEETINGS = pd.DataFrame({'Time' : ['M-TH 0800-0930', 'W 2030-2200', 'SAT 0700-1000', 'T-F 1300-1430', 'F 1600-1700', 'TBA'],
+                         'Room' : ['SEC-A101', 'SEC-A101', 'SEC-A101', 'CTC-201', 'SEC-A101; CTC-201', 'TBA']})
+ROOMS = pd.DataFrame({'Room' : ['CTC-201', 'SEC-A101', 'SEC-A102'], 'Building' : ['CTC', 'SEC-A', 'SEC-A']})
+
+@pytest.fixture
+def catalog():
+    occupancy = build_occupancy(MEETINGS, parse_masks(MEETINGS['Time']), ROOMS['Room'])
+    return SimpleNamespace(room_occupancy = occupancy, complete_rooms = ROOMS)
+
+def test_build_occupancy(catalog):
+    monday, wednesday, friday, saturday = [2, 3, 4], [87, 88, 89], [138, 139], [150, 151, 152, 153, 154, 155]
+    thursday = [slot + 90 for slot in monday]
+    assert np.flatnonzero(catalog.room_occupancy[1]).tolist() == monday + wednesday + thursday + friday + saturday
+    assert np.flatnonzero(catalog.room_occupancy[0]).tolist() == [42, 43, 44, 132, 133, 134] + friday
+    assert not catalog.room_occupancy[2].any()
+
+@pytest.mark.parametrize('day, start, end, slots', [
+    (0, 1300, 1430, [12, 13, 14]),
+    (0, 2030, 2300, [27, 28, 29]), #not into Tuesday
+    (1, 600, 730, [30]), #not from the end of Monday
+    (5, 2130, 2200, [179]),
+])
+def test_window_slots(day, start, end, slots):
+    assert np.flatnonzero(window_slots(day, start, end)).tolist() == slots
+
+@pytest.mark.parametrize('day, start, end, bldg, rooms', [
+    (0, 800, 830, None, ['CTC-201', 'SEC-A102']),
+    (0, 930, 1300, None, ['CTC-201', 'SEC-A101', 'SEC-A102']),
+    (0, 800, 830, 'SEC-A', ['SEC-A102']),
+    (2, 2130, 2200, None, ['CTC-201', 'SEC-A102']), #the last slot
+    (2, 2130, 2300, None, ['CTC-201', 'SEC-A102']),
+    (3, 2100, 2200, None, ['CTC-201', 'SEC-A101', 'SEC-A102']), #not the classes of Friday morning
+    (4, 1630, 1700, None, ['SEC-A102']),
+])
+def test_free_rooms(catalog, day, start, end, bldg, rooms):
+    assert free_rooms(catalog, window_slots(day, start, end), bldg)['Room'].tolist() == rooms
+
+def test_free_windows(catalog):
+    windows = free_windows(catalog, 2)
+    assert windows.values.tolist() == [['CTC-201', 'CTC', '0700', '2200', 900],
+                                       ['SEC-A101', 'SEC-A', '0700', '2030', 810],
+                                       ['SEC-A102', 'SEC-A', '0700', '2200', 900]]
+    windows = free_windows(catalog, 0, bldg = 'SEC-A')
+    assert windows[['Room', 'From', 'To', 'Minutes']].values.tolist() == [['SEC-A101', '0700', '0800', 60],
+                                                                          ['SEC-A101', '0930', '2200', 750],
+                                                                          ['SEC-A102', '0700', '2200', 900]]
+
+def test_free_windows_min_minutes(catalog):
+    windows = free_windows(catalog, 0, 700, 1000, min_minutes = 90)
+    assert windows[['Room', 'From', 'To']].values.tolist() == [['CTC-201', '0700', '1000'], ['SEC-A102', '0700', '1000']]
+    windows = free_windows(catalog, 5, 900, 1100, min_minutes = 60, bldg = 'SEC-A')
+    assert windows[['Room', 'From', 'To']].values.tolist() == [['SEC-A101', '1000', '1100'], ['SEC-A102', '0900', '1100']]
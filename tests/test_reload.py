@@ -0,0 +1,18 @@
+''' Keeping the current catalog, and saying why, when a new snapshot folder fails to load.'''
+
+import logging
+
+from facile.reload import SnapshotWatcher
+
+FOLDER = 'schedules_2024-1_20240704_2024'
+
+def test_failed_reload_keeps_catalog_and_logs(caplog, tmp_path):
+    watcher = SnapshotWatcher(folder = FOLDER)
+    catalog = watcher.catalog
+    broken = str(tmp_path / 'schedules_2024-2_20241201')
+    watcher.folder, watcher.checked = broken, None
+    with caplog.at_level(logging.ERROR, logger = 'facile.reload'):
+        assert watcher.refresh() is catalog
+    assert len(caplog.records) == 1
+    assert broken in caplog.records[0].getMessage()
+    assert caplog.records[0].exc_info is not None
@@ -0,0 +1,52 @@
+''' The columnar file of a snapshot folder is only used while it matches what it was built from.'''
+
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from facile import snapshot
+from facile.catalog import build_complete_list, load_complete_list
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FOLDER = 'schedules_2024-1_20240704_2024'
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    ''' A copy of a snapshot folder, depts.csv and prefixes.csv without its columnar file.'''
+
+    shutil.copytree(os.path.join(REPO, FOLDER), tmp_path / FOLDER, ignore = shutil.ignore_patterns(snapshot.SNAPSHOT_FILE))
+    for name in ['depts.csv', 'prefixes.csv']:
+        shutil.copy(os.path.join(REPO, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_read_snapshot_matches_csvs(workdir):
+    assert snapshot.read_snapshot(FOLDER) is None
+    snapshot.ingest(FOLDER)
+    complete_list, masks = snapshot.read_snapshot(FOLDER)
+    expected_list, expected_masks = build_complete_list(FOLDER)
+    assert complete_list.equals(expected_list)
+    assert (masks == expected_masks).all()
+
+@pytest.mark.parametrize('path', [os.path.join(FOLDER, 'bio.csv'), 'depts.csv', 'prefixes.csv'])
+def test_changed_csv_makes_file_stale(workdir, path):
+    snapshot.ingest(FOLDER)
+    assert os.path.exists(path)
+    with open(path, 'a') as file:
+        file.write('\n')
+    assert snapshot.read_snapshot(FOLDER) is None
+
+def test_new_format_version_makes_file_stale(workdir, monkeypatch):
+    snapshot.ingest(FOLDER)
+    monkeypatch.setattr(snapshot, 'FORMAT_VERSION', snapshot.FORMAT_VERSION + 1)
+    assert snapshot.read_snapshot(FOLDER) is None
+
+def test_first_load_writes_file(workdir):
+    complete_list, _ = load_complete_list(FOLDER)
+    assert os.path.exists(snapshot.snapshot_path(FOLDER))
+    read_list, _ = snapshot.read_snapshot(FOLDER)
+    assert read_list.equals(complete_list)
+    for column in snapshot.categorical_columns: #one string per value, not per row
+        assert isinstance(read_list[column].dtype, pd.CategoricalDtype)
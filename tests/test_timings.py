@@ -0,0 +1,41 @@
+''' Recording the memory of the stages of a run only when no other run overlaps them, as tracemalloc traces the whole
+process.'''
+
+import threading
+import tracemalloc
+
+import pytest
+
+from facile.timings import RunTimings
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+def test_memory_of_one_run(tracing):
+    run = RunTimings()
+    with run.stage('Catalog'):
+        data = bytearray(2 ** 20)
+    assert run.stages[0]['allocated_mb'] >= 1
+    assert run.stages[0]['peak_mb'] >= 1
+    del data
+
+def test_overlapping_runs_only_get_times(tracing):
+    started, done = threading.Barrier(2), threading.Barrier(2)
+    runs = [RunTimings(), RunTimings()]
+
+    def work(run):
+        with run.stage('Catalog'):
+            started.wait()
+            done.wait()
+
+    threads = [threading.Thread(target = work, args = (run,)) for run in runs]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    for run in runs:
+        assert 'seconds' in run.stages[0] and 'peak_mb' not in run.stages[0]
+    with runs[0].stage('Map'): #alone again
+        pass
+    assert 'peak_mb' in runs[0].stages[1]
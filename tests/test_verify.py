@@ -0,0 +1,110 @@
+''' Probing the variants of syllabus links against a local server: at most concurrency requests at a time, the first
+variant in order that loads wins, and cached links are not probed again.'''
+
+import asyncio
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+
+import pytest
+
+from facile.verify import find_links, link_url, link_variants, professors, section_key, verify_links
+
+SECTION = ('MATH 10', 'A', 'DELA CRUZ, JUAN, SANTOS, JR., MARIA', '2024', '1')
+DELAY = 0.02 # seconds per request, so that requests overlap
+
+class Server(http.server.ThreadingHTTPServer):
+    ''' Answers HEAD requests with a PDF on the paths in pdfs, after the delay of the path, and counts the requests.'''
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), Handler)
+        self.pdfs = set()
+        self.delays = {}
+        self.paths = []
+        self.active = 0
+        self.most_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, link):
+        ''' Returns the path a link is requested at.'''
+
+        return urllib.parse.unquote(urllib.parse.urlsplit(link_url(link)).path)
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        server = self.server
+        path = urllib.parse.unquote(self.path)
+        with server.lock:
+            server.paths.append(path)
+            server.active += 1
+            server.most_active = max(server.most_active, server.active)
+        time.sleep(server.delays.get(path, DELAY))
+        with server.lock:
+            server.active -= 1
+        if path in server.pdfs:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+        else:
+            self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = Server()
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.mark.parametrize('instructor, profs', [
+    ('BEJA, EDSEL, JR. L., DUCANES, Geoffrey', [('BEJA', 'EDSEL', 'JR.'), ('DUCANES', 'Geoffrey', None)]),
+    ('FUNG, FR. JOJO, S.J., NONO, Grace, PORIO, EMMA E.',
+     [('FUNG', 'FR. JOJO', 'S.J.'), ('NONO', 'Grace', None), ('PORIO', 'EMMA E.', None)]),
+    ('DELA CRUZ, JUAN, SANTOS, JR., MARIA', [('DELA CRUZ', 'JUAN', None), ('SANTOS', 'MARIA', 'JR.')]),
+    ('GO, SJ, JOHNNY C.', [('GO', 'JOHNNY C.', 'SJ')]),
+])
+def test_professors_keep_suffixes_with_their_names(instructor, profs):
+    assert professors(instructor) == profs
+
+def test_link_variants_of_suffix_after_first_name():
+    variants = link_variants('ECON 10', 'A', 'BEJA, EDSEL, JR. L., DUCANES, Geoffrey', '2024', '1')
+    assert variants[0] == 'aisis.ateneo.edu/syllabi/2024/1/CS-EC-ECON10-BEJA, JR._E_DUCANES_G-A-2024-1.pdf'
+    assert not any('JR. L.' in link or 'Geoffrey' in link for link in variants)
+
+def run(sections, server, concurrency, cache = None):
+    return asyncio.run(find_links(sections, server.base_url, concurrency, cache))
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_find_links_caps_concurrent_requests(server, concurrency):
+    sections = [SECTION[:1] + (section,) + SECTION[2:] for section in 'ABCDEF']
+    assert run(sections, server, concurrency) == [None] * len(sections)
+    assert len(server.paths) == len(sections) * len(link_variants(*SECTION))
+    assert server.most_active == concurrency
+
+def test_find_links_keeps_first_variant_in_order(server):
+    variants = link_variants(*SECTION)
+    for i in [2, 5, 8]:
+        server.pdfs.add(server.url(variants[i]))
+    server.delays[server.url(variants[2])] = 0.3 #the later variants that load answer first
+    assert run([SECTION], server, 4) == [variants[2]]
+
+def test_verify_links_uses_cache(server, tmp_path):
+    variants = link_variants(*SECTION)
+    server.pdfs.add(server.url(variants[3]))
+    cache_file = str(tmp_path / 'cache.json')
+    assert verify_links([SECTION], server.base_url, 4, cache_file) == [variants[3]]
+    with open(cache_file) as file:
+        assert json.load(file) == {section_key(*SECTION) : variants[3]}
+
+    probed = len(server.paths)
+    assert verify_links([SECTION], server.base_url, 4, cache_file) == [variants[3]]
+    assert len(server.paths) == probed